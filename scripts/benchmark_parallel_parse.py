@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""Measure when parsing documents in a process pool pays off.
+
+Prints the serial parser throughput, the cost of starting a spawn worker,
+and the amount of source above which a pool of N workers is expected to be
+faster than parsing serially. Rates are measured over sets of chapter-sized
+documents, which is what a pool parses. This is the basis for
+dacli.index_builder.PARALLEL_PARSE_MIN_BYTES.
+
+Usage: python scripts/benchmark_parallel_parse.py [WORKERS ...]
+"""
+
+import multiprocessing
+import pickle
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from dacli.asciidoc_parser import AsciidocStructureParser, parse_asciidoc_file
+from dacli.markdown_parser import MarkdownStructureParser
+
+PROSE_CHUNK = """== Section {i}
+
+Plain paragraph text as found in most chapters, running over a couple of
+lines without any markup, blocks or tables in it. Chapters tend to have a
+few paragraphs per section, so this one is repeated.
+
+Plain paragraph text as found in most chapters, running over a couple of
+lines without any markup, blocks or tables in it. Chapters tend to have a
+few paragraphs per section, so this one is repeated.
+
+"""
+
+ADOC_CHUNK = """== Section {i}
+
+Some text with *bold* and `code`, and a https://example.org[link].
+
+[source,python]
+----
+def f(x):
+    return x * {i}
+----
+
+|===
+| A | B
+| 1 | 2
+|===
+
+"""
+
+MD_CHUNK = """## Section {i}
+
+Some text with **bold** and `code`, and a [link](https://example.org).
+
+```python
+def f(x):
+    return x * {i}
+```
+
+- item one
+- item two
+
+"""
+
+
+def _throughput(parser, files: list[Path]) -> tuple[float, float, float]:
+    """Parse files serially.
+
+    Returns:
+        MB/s, and the time to pickle and to unpickle the results, each as a
+        fraction of the parse time
+    """
+    parser.parse_file(files[0])  # warm up
+    start = time.perf_counter()
+    documents = [parser.parse_file(file_path) for file_path in files]
+    parse_time = time.perf_counter() - start
+    start = time.perf_counter()
+    data = pickle.dumps(documents)
+    dump_time = time.perf_counter() - start
+    start = time.perf_counter()
+    pickle.loads(data)
+    load_time = time.perf_counter() - start
+    size = sum(file_path.stat().st_size for file_path in files)
+    return size / parse_time / 1e6, dump_time / parse_time, load_time / parse_time
+
+
+def _chapters(root: Path, name: str, header: str, chunk: str, sections: int) -> list[Path]:
+    """Write 20 chapter-sized documents and return their paths."""
+    files = []
+    for number in range(20):
+        file_path = root / f"{name}{number}{Path(name).suffix}"
+        file_path.write_text(header + "".join(chunk.format(i=i) for i in range(sections)))
+        files.append(file_path)
+    return files
+
+
+def _startup_cost(small: Path) -> float:
+    """Seconds to start one spawn worker and parse a trivial file in it."""
+    start = time.perf_counter()
+    with ProcessPoolExecutor(1, mp_context=multiprocessing.get_context("spawn")) as pool:
+        pool.submit(parse_asciidoc_file, small, small.parent).result()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    workers = [int(arg) for arg in sys.argv[1:]] or [2, 4, 8]
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        prose = _chapters(root, "prose.adoc", "= Prose\n\n", PROSE_CHUNK, 100)
+        adoc = _chapters(root, "blocks.adoc", "= Blocks\n\n", ADOC_CHUNK, 100)
+        md = _chapters(root, "blocks.md", "# Blocks\n\n", MD_CHUNK, 100)
+        small = root / "small.adoc"
+        small.write_text("= Small\n\n== Part\n")
+
+        rates = {
+            "AsciiDoc prose": _throughput(AsciidocStructureParser(root), prose),
+            "AsciiDoc blocks": _throughput(AsciidocStructureParser(root), adoc),
+            "Markdown blocks": _throughput(MarkdownStructureParser(root), md),
+        }
+        startup = _startup_cost(small)
+
+    for name, (rate, dump, load) in rates.items():
+        print(f"{name}: {rate:.2f} MB/s, pickling {dump:.0%} + unpickling {load:.0%} of parse time")
+    print(f"Spawn worker startup: {startup:.2f} s")
+
+    # With W workers, workers parse and pickle in parallel while the parent
+    # unpickles every result:
+    #   pool time ~ startup + serial * (1 + dump) / W + serial * load
+    # so the pool wins once serial * (1 - (1 + dump) / W - load) > startup.
+    for count in workers:
+        needed = []
+        for name, (rate, dump, load) in rates.items():
+            gain = 1 - (1 + dump) / count - load
+            needed.append(startup / gain * rate if gain > 0 else float("inf"))
+        print(f"{count} workers: pool wins above {max(needed):.1f} MB of source")
+
+
+if __name__ == "__main__":
+    main()
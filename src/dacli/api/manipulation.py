@@ -45,8 +45,7 @@ def _get_section_end_line(section: Section, file_path: FilePath) -> int:
 
     # Fallback: read file to get total lines
     try:
-        content = _file_handler.read_file(file_path)
-        return len(content.splitlines())
+        return _file_handler.count_lines(file_path)
     except FileReadError:
         return section.source_location.line + 10  # Last resort fallback
 
@@ -115,7 +114,7 @@ def update_section(
     new_content = request.content
     if request.preserve_title:
         stripped_content = new_content.lstrip()
-        has_explicit_title = stripped_content.startswith("=") or stripped_content.startswith("#")
+        has_explicit_title = stripped_content.startswith(("=", "#"))
         if not has_explicit_title:
             # Prepend the original title line
             level_markers = "=" * (section.level + 1)
@@ -7,6 +7,7 @@ AC-ADOC-06, AC-ADOC-07), and cross-references (AC-ADOC-08).
 """
 
 import re
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -49,6 +50,10 @@ BLOCK_DELIMITER_PATTERN = re.compile(r"^(-{4,}|\.{4,}|\*{4,}|={4,}|_{4,})$")
 TABLE_DELIMITER_PATTERN = re.compile(r"^\|===$")
 IMAGE_PATTERN = re.compile(r"^image::(.+?)\[(.*)?\]$")
 ADMONITION_PATTERN = re.compile(r"^(NOTE|TIP|IMPORTANT|WARNING|CAUTION):\s*(.*)$")
+# Literal prefilter for ADMONITION_PATTERN: the label before the colon must be
+# one of these, so the colon is never further right than the longest label
+ADMONITION_TYPES = frozenset({"NOTE", "TIP", "IMPORTANT", "WARNING", "CAUTION"})
+_ADMONITION_LABEL_MAX_LEN = max(len(t) for t in ADMONITION_TYPES)
 
 # Cross-reference pattern: <<target>> or <<target,display text>>
 XREF_PATTERN = re.compile(r"<<([^,>]+)(?:,([^>]+))?>>", re.MULTILINE)
@@ -74,6 +79,11 @@ class CircularIncludeError(Exception):
         chain_str = " -> ".join(str(p.name) for p in include_chain)
         super().__init__(f"Circular include detected: {chain_str} -> {file_path.name}")
 
+    def __reduce__(self):
+        # Rebuild from the constructor arguments so the error survives the
+        # round-trip out of a worker process (see parse_asciidoc_file)
+        return (self.__class__, (self.file_path, self.include_chain))
+
 
 
 @dataclass
@@ -276,11 +286,20 @@ class AsciidocStructureParser:
             expanded_lines, file_path, attributes
         )
 
+        # Without includes every expanded line is a line of this file, in order,
+        # so the last line number is known without scanning the expanded lines
+        if includes:
+            lines_per_file = self._count_lines_per_file(expanded_lines)
+        else:
+            lines_per_file = {file_path: len(lines)}
+
         # Calculate end_line for all sections
-        self._compute_end_lines(sections, expanded_lines)
+        self._compute_end_lines(sections, lines_per_file)
 
         # Parse elements with section context
-        elements, parse_warnings = self._parse_elements(expanded_lines, sections, attributes)
+        elements, parse_warnings = self._parse_elements(
+            expanded_lines, sections, attributes, lines_per_file
+        )
 
         # Parse cross-references
         cross_references = self._parse_cross_references(expanded_lines)
@@ -317,9 +336,41 @@ class AsciidocStructureParser:
         Raises:
             CircularIncludeError: If a circular include is detected
         """
-        expanded: list[tuple[str, Path, int, SourceLocation | None]] = []
         includes: list[IncludeInfo] = []
+        expanded = list(
+            self._iter_expanded_lines(lines, file_path, depth, include_chain, includes)
+        )
+        return expanded, includes
+
+    def _iter_expanded_lines(
+        self,
+        lines: Iterable[str],
+        file_path: Path,
+        depth: int,
+        include_chain: list[Path],
+        includes: list[IncludeInfo],
+        resolved_from: SourceLocation | None = None,
+    ) -> Iterator[tuple[str, Path, int, SourceLocation | None]]:
+        """Lazily expand include directives, yielding lines with source info.
 
+        Nested includes are streamed through ``yield from`` so included lines
+        are not copied into an intermediate list at every nesting level.
+
+        Args:
+            lines: Document lines
+            file_path: Path to the source file
+            depth: Current include depth
+            include_chain: Chain of files for circular include detection
+            includes: List collecting IncludeInfo (modified in place)
+            resolved_from: Include directive location for lines of this file
+                (None for the root document)
+
+        Yields:
+            Tuples of (line, source file, line number, resolved_from)
+
+        Raises:
+            CircularIncludeError: If a circular include is detected
+        """
         for line_num, line in enumerate(lines, start=1):
             match = INCLUDE_PATTERN.match(line)
             if match and depth < self.max_include_depth:
@@ -352,27 +403,19 @@ class AsciidocStructureParser:
                 # Expand the included file
                 if target_path.exists():
                     included_content = target_path.read_text(encoding="utf-8")
-                    included_lines = included_content.splitlines()
-
-                    # Create resolved_from reference
-                    resolved_from = SourceLocation(file=file_path, line=line_num)
 
-                    # Recursively expand includes in the included file
-                    new_chain = include_chain + [target_path]
-                    nested_expanded, nested_includes = self._expand_includes(
-                        included_lines, target_path, depth + 1, new_chain
+                    # Lines of the included file point back to this directive;
+                    # deeper includes keep their own (innermost) resolved_from
+                    yield from self._iter_expanded_lines(
+                        included_content.splitlines(),
+                        target_path,
+                        depth + 1,
+                        include_chain + [target_path],
+                        includes,
+                        SourceLocation(file=file_path, line=line_num),
                     )
-                    includes.extend(nested_includes)
-
-                    # Add expanded lines with resolved_from info
-                    for inc_line, inc_file, inc_line_num, inc_resolved in nested_expanded:
-                        # Preserve original resolved_from or use current include location
-                        final_resolved = inc_resolved if inc_resolved else resolved_from
-                        expanded.append((inc_line, inc_file, inc_line_num, final_resolved))
             else:
-                expanded.append((line, file_path, line_num, None))
-
-        return expanded, includes
+                yield (line, file_path, line_num, resolved_from)
 
     def _parse_attributes(self, lines: list[str]) -> dict[str, str]:
         """Parse document attributes from lines.
@@ -474,15 +517,18 @@ class AsciidocStructureParser:
         # Issue #207: Track block state to avoid parsing sections inside code/literal blocks
         in_delimited_block = False
         in_table = False
+        match_block_delimiter = BLOCK_DELIMITER_PATTERN.match
+        match_table_delimiter = TABLE_DELIMITER_PATTERN.match
+        match_section = SECTION_PATTERN.match
 
         for line_text, source_file, line_num, resolved_from in lines:
             # Issue #207: Track delimited blocks (----, ...., ****, ====, ____)
-            if BLOCK_DELIMITER_PATTERN.match(line_text):
+            if match_block_delimiter(line_text):
                 in_delimited_block = not in_delimited_block
                 continue
 
             # Issue #207: Track table blocks (|===)
-            if TABLE_DELIMITER_PATTERN.match(line_text):
+            if match_table_delimiter(line_text):
                 in_table = not in_table
                 continue
 
@@ -490,7 +536,7 @@ class AsciidocStructureParser:
             if in_delimited_block or in_table:
                 continue
 
-            match = SECTION_PATTERN.match(line_text)
+            match = match_section(line_text)
             if match:
                 equals = match.group(1)
                 raw_title = match.group(2).strip()
@@ -556,10 +602,30 @@ class AsciidocStructureParser:
 
         return sections, document_title
 
+    def _count_lines_per_file(
+        self,
+        lines: Iterable[tuple[str, Path, int, SourceLocation | None]],
+    ) -> dict[Path, int]:
+        """Find the last line number seen for each source file.
+
+        Args:
+            lines: Expanded lines with source info
+
+        Returns:
+            Dict mapping each source file to its highest line number
+        """
+        lines_per_file: dict[Path, int] = {}
+        for _, source_file, line_num, _ in lines:
+            if source_file not in lines_per_file:
+                lines_per_file[source_file] = line_num
+            else:
+                lines_per_file[source_file] = max(lines_per_file[source_file], line_num)
+        return lines_per_file
+
     def _compute_end_lines(
         self,
         sections: list[Section],
-        lines: list[tuple[str, Path, int, SourceLocation | None]],
+        lines_per_file: dict[Path, int],
     ) -> None:
         """Compute end_line for all sections.
 
@@ -568,7 +634,7 @@ class AsciidocStructureParser:
 
         Args:
             sections: List of parsed sections (modified in place)
-            lines: Expanded lines with source info
+            lines_per_file: Last line number of each source file
         """
         # Collect all sections with their file paths and start lines
         all_sections: list[Section] = []
@@ -585,14 +651,6 @@ class AsciidocStructureParser:
                 sections_by_file[file_path] = []
             sections_by_file[file_path].append(section)
 
-        # Count lines per file from expanded lines
-        lines_per_file: dict[Path, int] = {}
-        for _, source_file, line_num, _ in lines:
-            if source_file not in lines_per_file:
-                lines_per_file[source_file] = line_num
-            else:
-                lines_per_file[source_file] = max(lines_per_file[source_file], line_num)
-
         # For each file, sort sections by start line and compute end_line
         for file_path, file_sections in sections_by_file.items():
             # Sort by start line
@@ -705,6 +763,7 @@ class AsciidocStructureParser:
         lines: list[tuple[str, Path, int, SourceLocation | None]],
         sections: list[Section],
         attributes: dict[str, str],
+        lines_per_file: dict[Path, int],
     ) -> tuple[list[Element], list[ParseWarning]]:
         """Parse elements from document lines.
 
@@ -712,6 +771,7 @@ class AsciidocStructureParser:
             lines: Expanded lines with source info
             sections: Parsed sections for parent context
             attributes: Document attributes for substitution
+            lines_per_file: Last line number of each source file
 
         Returns:
             Tuple of (elements, parse_warnings)
@@ -732,13 +792,27 @@ class AsciidocStructureParser:
         current_list_element: Element | None = None  # Track list for end_line (#136)
         # Track ALL open blocks for end_line (Issue #157: use stack instead of single element)
         open_blocks: list[Element] = []
-        # Content tracking for Issue #159
+        # Content tracking for Issue #159. The buffers are cleared and reused for
+        # each block; the joined string stored on the element is an independent copy
         code_block_content: list[str] = []
         plantuml_content: list[str] = []
         mermaid_content: list[str] = []
         ditaa_content: list[str] = []
         table_content: list[str] = []
         list_content: list[str] = []
+        # Bind pattern matchers to locals: this loop runs once per line, and local
+        # lookups are cheaper than global + attribute lookups in CPython
+        match_section = SECTION_PATTERN.match
+        match_code_attr = CODE_BLOCK_START_PATTERN.match
+        match_plantuml_attr = PLANTUML_BLOCK_START_PATTERN.match
+        match_mermaid_attr = MERMAID_BLOCK_START_PATTERN.match
+        match_ditaa_attr = DITAA_BLOCK_START_PATTERN.match
+        match_listing_delimiter = LISTING_DELIMITER_PATTERN.match
+        match_table_delimiter = TABLE_DELIMITER_PATTERN.match
+        match_image = IMAGE_PATTERN.match
+        match_unordered_list = UNORDERED_LIST_PATTERN.match
+        match_ordered_list = ORDERED_LIST_PATTERN.match
+        match_description_list = DESCRIPTION_LIST_PATTERN.match
 
         for line_text, source_file, line_num, resolved_from in lines:
             # Issue #207: Track current section for parent_section (but skip if inside blocks)
@@ -750,7 +824,27 @@ class AsciidocStructureParser:
                 or in_table
             )
             if not in_any_block:
-                section_match = SECTION_PATTERN.match(line_text)
+                # Blank lines outside blocks cannot start an element and do not
+                # end a list, so skip the detection cascade for them entirely
+                if not line_text or line_text.isspace():
+                    continue
+                # Line comments are never content; they do separate lists
+                if line_text.startswith("//"):
+                    if current_list_type is not None:
+                        # Save list content before reset (Issue #159)
+                        if current_list_element is not None and list_content:
+                            current_list_element.attributes["content"] = "\n".join(
+                                list_content
+                            )
+                        current_list_type = None
+                        current_list_element = None
+                    continue
+
+            # Every structural pattern below is anchored on a distinctive first
+            # character, so dispatch on it and only run the regex that can match
+            first_char = line_text[:1]
+            if not in_any_block and first_char == "=":
+                section_match = match_section(line_text)
                 if section_match:
                     title = section_match.group(2).strip()
                     # Apply attribute substitution to section titles so they match
@@ -764,38 +858,33 @@ class AsciidocStructureParser:
                     current_section_path = self._find_section_path(sections, title)
                     continue
 
-            # Detect code block attribute [source,language]
-            code_attr_match = CODE_BLOCK_START_PATTERN.match(line_text)
-            if code_attr_match:
-                pending_code_language = code_attr_match.group(1)
-                continue
+            if first_char == "[":
+                # Detect code block attribute [source,language]
+                code_attr_match = match_code_attr(line_text)
+                if code_attr_match:
+                    pending_code_language = code_attr_match.group(1)
+                    continue
 
-            # Detect plantuml block attribute [plantuml,name,format]
-            plantuml_attr_match = PLANTUML_BLOCK_START_PATTERN.match(line_text)
-            if plantuml_attr_match:
-                name = plantuml_attr_match.group(1)
-                fmt = plantuml_attr_match.group(2)
-                pending_plantuml_info = (name, fmt)
-                continue
+                # Detect plantuml block attribute [plantuml,name,format]
+                plantuml_attr_match = match_plantuml_attr(line_text)
+                if plantuml_attr_match:
+                    pending_plantuml_info = plantuml_attr_match.groups()
+                    continue
 
-            # Detect mermaid block attribute [mermaid,name,format]
-            mermaid_attr_match = MERMAID_BLOCK_START_PATTERN.match(line_text)
-            if mermaid_attr_match:
-                name = mermaid_attr_match.group(1)
-                fmt = mermaid_attr_match.group(2)
-                pending_mermaid_info = (name, fmt)
-                continue
+                # Detect mermaid block attribute [mermaid,name,format]
+                mermaid_attr_match = match_mermaid_attr(line_text)
+                if mermaid_attr_match:
+                    pending_mermaid_info = mermaid_attr_match.groups()
+                    continue
 
-            # Detect ditaa block attribute [ditaa,name,format]
-            ditaa_attr_match = DITAA_BLOCK_START_PATTERN.match(line_text)
-            if ditaa_attr_match:
-                name = ditaa_attr_match.group(1)
-                fmt = ditaa_attr_match.group(2)
-                pending_ditaa_info = (name, fmt)
-                continue
+                # Detect ditaa block attribute [ditaa,name,format]
+                ditaa_attr_match = match_ditaa_attr(line_text)
+                if ditaa_attr_match:
+                    pending_ditaa_info = ditaa_attr_match.groups()
+                    continue
 
             # Detect listing delimiter ----
-            if LISTING_DELIMITER_PATTERN.match(line_text):
+            if first_char == "-" and match_listing_delimiter(line_text):
                 in_any_block = (
                     in_code_block or in_plantuml_block or in_mermaid_block or in_ditaa_block
                 )
@@ -803,7 +892,7 @@ class AsciidocStructureParser:
                     if pending_plantuml_info is not None:
                         # Start of plantuml block
                         in_plantuml_block = True
-                        plantuml_content = []  # Initialize content tracking (Issue #159)
+                        plantuml_content.clear()  # Reuse content buffer (Issue #159)
                         name, fmt = pending_plantuml_info
                         element = self._create_diagram_element(
                             "plantuml", name, fmt, source_file, line_num,
@@ -815,7 +904,7 @@ class AsciidocStructureParser:
                     elif pending_mermaid_info is not None:
                         # Start of mermaid block
                         in_mermaid_block = True
-                        mermaid_content = []  # Initialize content tracking (Issue #159)
+                        mermaid_content.clear()  # Reuse content buffer (Issue #159)
                         name, fmt = pending_mermaid_info
                         element = self._create_diagram_element(
                             "mermaid", name, fmt, source_file, line_num,
@@ -827,7 +916,7 @@ class AsciidocStructureParser:
                     elif pending_ditaa_info is not None:
                         # Start of ditaa block
                         in_ditaa_block = True
-                        ditaa_content = []  # Initialize content tracking (Issue #159)
+                        ditaa_content.clear()  # Reuse content buffer (Issue #159)
                         name, fmt = pending_ditaa_info
                         element = self._create_diagram_element(
                             "ditaa", name, fmt, source_file, line_num,
@@ -839,7 +928,7 @@ class AsciidocStructureParser:
                     elif pending_code_language is not None:
                         # Start of code block
                         in_code_block = True
-                        code_block_content = []  # Initialize content tracking (Issue #159)
+                        code_block_content.clear()  # Reuse content buffer (Issue #159)
                         source_location = SourceLocation(
                             file=source_file,
                             line=line_num,
@@ -881,11 +970,11 @@ class AsciidocStructureParser:
                 continue
 
             # Detect table delimiter |===
-            if TABLE_DELIMITER_PATTERN.match(line_text):
+            if first_char == "|" and match_table_delimiter(line_text):
                 if not in_table:
                     # Start of table
                     in_table = True
-                    table_content = []  # Initialize content tracking (Issue #159)
+                    table_content.clear()  # Reuse content buffer (Issue #159)
                     source_location = SourceLocation(
                         file=source_file,
                         line=line_num,
@@ -908,10 +997,9 @@ class AsciidocStructureParser:
                 continue
 
             # Detect image macro
-            image_match = IMAGE_PATTERN.match(line_text)
+            image_match = match_image(line_text) if first_char == "i" else None
             if image_match:
-                target = image_match.group(1)
-                alt_text = image_match.group(2) or ""
+                target, alt_text = image_match.groups(default="")
                 source_location = SourceLocation(
                     file=source_file,
                     line=line_num,
@@ -928,11 +1016,12 @@ class AsciidocStructureParser:
                 )
                 continue
 
-            # Detect admonition
-            admonition_match = ADMONITION_PATTERN.match(line_text)
-            if admonition_match:
-                admonition_type = admonition_match.group(1)
-                content = admonition_match.group(2)
+            # Detect admonition (equivalent to ADMONITION_PATTERN, but only looks
+            # at the first few characters instead of running a regex per line)
+            colon_pos = line_text.find(":", 0, _ADMONITION_LABEL_MAX_LEN + 1)
+            if colon_pos > 0 and line_text[:colon_pos] in ADMONITION_TYPES:
+                admonition_type = line_text[:colon_pos]
+                content = line_text[colon_pos + 1 :].lstrip()
                 source_location = SourceLocation(
                     file=source_file,
                     line=line_num,
@@ -956,14 +1045,14 @@ class AsciidocStructureParser:
 
             # Detect lists (unordered, ordered, description)
             # Check for unordered list (* item)
-            if UNORDERED_LIST_PATTERN.match(line_text):
+            if first_char == "*" and match_unordered_list(line_text):
                 if current_list_type != "unordered":
                     # Save previous list content if any (Issue #159)
                     if current_list_element is not None and list_content:
                         current_list_element.attributes["content"] = "\n".join(list_content)
                     # Start of a new unordered list
                     current_list_type = "unordered"
-                    list_content = []  # Initialize content tracking (Issue #159)
+                    list_content.clear()  # Reuse content buffer (Issue #159)
                     current_list_element = self._create_list_element(
                         "unordered", source_file, line_num,
                         resolved_from, current_section_path,
@@ -977,14 +1066,14 @@ class AsciidocStructureParser:
                 continue
 
             # Check for ordered list (. item)
-            if ORDERED_LIST_PATTERN.match(line_text):
+            if first_char == "." and match_ordered_list(line_text):
                 if current_list_type != "ordered":
                     # Save previous list content if any (Issue #159)
                     if current_list_element is not None and list_content:
                         current_list_element.attributes["content"] = "\n".join(list_content)
                     # Start of a new ordered list
                     current_list_type = "ordered"
-                    list_content = []  # Initialize content tracking (Issue #159)
+                    list_content.clear()  # Reuse content buffer (Issue #159)
                     current_list_element = self._create_list_element(
                         "ordered", source_file, line_num,
                         resolved_from, current_section_path,
@@ -998,7 +1087,7 @@ class AsciidocStructureParser:
                 continue
 
             # Check for description list (term:: definition)
-            if DESCRIPTION_LIST_PATTERN.match(line_text):
+            if match_description_list(line_text):
                 if current_list_type != "description":
                     # Start of a new description list
                     current_list_type = "description"
@@ -1012,35 +1101,37 @@ class AsciidocStructureParser:
                     current_list_element.source_location.end_line = line_num
                 continue
 
-            # If line is not a list item, reset list tracking
-            if line_text.strip():
+            # If line is not a list item, reset list tracking. Only non-blank lines
+            # end a list; check the (usually absent) open list first so ordinary
+            # lines skip the test, and use isspace() to avoid building a copy.
+            if current_list_type is not None and line_text and not line_text.isspace():
                 # Save list content before reset (Issue #159)
                 if current_list_element is not None and list_content:
                     current_list_element.attributes["content"] = "\n".join(list_content)
                 current_list_type = None
                 current_list_element = None
 
-            # Collect content for open blocks (Issue #159)
-            if in_code_block:
-                code_block_content.append(line_text)
-            elif in_plantuml_block:
-                plantuml_content.append(line_text)
-            elif in_mermaid_block:
-                mermaid_content.append(line_text)
-            elif in_ditaa_block:
-                ditaa_content.append(line_text)
-            elif in_table:
-                table_content.append(line_text)
+            # Collect content for open blocks (Issue #159). Block states only
+            # change on lines that `continue` above, so in_any_block is still
+            # current and lines outside blocks skip the per-block checks
+            if in_any_block:
+                if in_code_block:
+                    code_block_content.append(line_text)
+                elif in_plantuml_block:
+                    plantuml_content.append(line_text)
+                elif in_mermaid_block:
+                    mermaid_content.append(line_text)
+                elif in_ditaa_block:
+                    ditaa_content.append(line_text)
+                else:
+                    table_content.append(line_text)
 
         # Handle ALL unclosed blocks - set end_line to last line of their source file
         # Issue #146: unclosed code blocks should have proper end_line
         # Issue #157: ALL unclosed blocks should be detected, not just the last one
         for unclosed_block in open_blocks:
             source_file = unclosed_block.source_location.file
-            max_line = max(
-                line_num for _, file, line_num, _ in lines if file == source_file
-            )
-            unclosed_block.source_location.end_line = max_line
+            unclosed_block.source_location.end_line = lines_per_file[source_file]
 
             # Add warning for unclosed block (Issue #148)
             block_type = unclosed_block.type
@@ -1091,7 +1182,7 @@ class AsciidocStructureParser:
 
     def _parse_cross_references(
         self,
-        lines: list[tuple[str, Path, int, SourceLocation | None]],
+        lines: Iterable[tuple[str, Path, int, SourceLocation | None]],
     ) -> list[CrossReference]:
         """Parse cross-references from document lines.
 
@@ -1102,12 +1193,17 @@ class AsciidocStructureParser:
             List of extracted cross-references
         """
         cross_references: list[CrossReference] = []
+        find_xrefs = XREF_PATTERN.finditer
 
         for line_text, source_file, line_num, resolved_from in lines:
+            # Most lines contain no xref; a substring test is much cheaper
+            # than setting up a regex scan
+            if "<<" not in line_text:
+                continue
             # Find all cross-references in the line
-            for match in XREF_PATTERN.finditer(line_text):
-                target = match.group(1).strip()
-                display_text = match.group(2)
+            for match in find_xrefs(line_text):
+                target, display_text = match.groups()
+                target = target.strip()
                 if display_text:
                     display_text = display_text.strip()
 
@@ -1127,3 +1223,28 @@ class AsciidocStructureParser:
                 )
 
         return cross_references
+
+
+def parse_asciidoc_file(
+    file_path: Path, base_path: Path, max_include_depth: int = 20
+) -> AsciidocDocument:
+    """Parse a single AsciiDoc file with a fresh parser.
+
+    Module-level so it can be handed to a process pool: each root document
+    is parsed independently (includes are expanded inside the worker), and
+    the resulting AsciidocDocument consists of picklable dataclasses.
+
+    Args:
+        file_path: Path to the AsciiDoc file
+        base_path: Base path for resolving relative paths and file prefixes
+        max_include_depth: Maximum depth for nested includes
+
+    Returns:
+        Parsed AsciidocDocument
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        CircularIncludeError: If a circular include is detected
+    """
+    parser = AsciidocStructureParser(base_path, max_include_depth=max_include_depth)
+    return parser.parse_file(file_path)
@@ -21,15 +21,16 @@ Commands (with aliases):
 import json
 import logging
 import sys
+from collections.abc import Callable, Iterable
+from functools import cache, cached_property
 from pathlib import Path
+from types import ModuleType
 
 import click
 
 from dacli import __version__
-from dacli.asciidoc_parser import AsciidocStructureParser
 from dacli.file_handler import FileReadError, FileSystemHandler, FileWriteError
-from dacli.markdown_parser import MarkdownStructureParser
-from dacli.mcp_app import _build_index
+from dacli.models import element_to_dict
 from dacli.services import (
     compute_hash,
     get_project_metadata,
@@ -41,9 +42,12 @@ from dacli.services import (
 from dacli.services import (
     validate_structure as service_validate_structure,
 )
-from dacli.services.content_service import _get_section_end_line
 from dacli.structure_index import Section, StructureIndex
 
+# Log to stderr (stdout carries the command output); the level is set per
+# invocation from the --verbose flag
+logging.basicConfig(format="%(levelname)s: %(message)s", stream=sys.stderr)
+
 
 def _process_escape_sequences(content: str) -> str:
     """Process common escape sequences without corrupting non-ASCII characters.
@@ -59,22 +63,22 @@ def _process_escape_sequences(content: str) -> str:
 
     Issue #193: Fixed encoding problem with umlauts
     """
-    # Process escape sequences in order (most specific first)
-    # Must process \\\\ first to avoid double-processing
-    return (
-        content
-        .replace('\\\\', '\x00')  # Temp marker for literal backslash
-        .replace('\\n', '\n')
-        .replace('\\t', '\t')
-        .replace('\\r', '\r')
-        .replace('\x00', '\\')  # Restore literal backslash
+    # Most content has no escapes at all; one scan instead of split and replaces
+    if "\\" not in content:
+        return content
+
+    # Split at literal backslashes (\\\\) first so they are not processed twice;
+    # unlike a temporary marker character this keeps NUL characters intact
+    return "\\".join(
+        part.replace("\\n", "\n").replace("\\t", "\t").replace("\\r", "\r")
+        for part in content.split("\\\\")
     )
 
 
 def _get_section_append_line(
     section: Section,
     index: StructureIndex,
-    file_handler: FileSystemHandler,
+    total_lines: int,
 ) -> int:
     """Get the line number where content should be appended (after all descendants).
 
@@ -84,44 +88,39 @@ def _get_section_append_line(
     Args:
         section: The parent section to append to
         index: Structure index for finding related sections
-        file_handler: File handler for reading files
+        total_lines: Number of lines in the section's file
 
     Returns:
         The line number where content should be inserted (1-based)
     """
-    file_path = section.source_location.file
-    all_sections = index.get_sections_by_file(file_path)
-
-    # Find all descendants (sections whose path starts with parent path)
-    # Issue #197: Handle both ":" separator (doc:section) and "." (section.subsection)
-    parent_path = section.path
-    descendants = []
-    for s in all_sections:
-        # Skip the parent itself
-        if s.path == parent_path:
-            continue
-        # Check if this is a descendant
-        # Level 1 children use ":" separator (e.g., "doc:child")
-        # Nested children use "." separator (e.g., "doc:child.grandchild")
-        if parent_path == "":
-            # Root document - all sections are descendants
-            if s.path != "":
-                descendants.append(s)
-        elif s.path.startswith(parent_path + ":") or s.path.startswith(parent_path + "."):
-            descendants.append(s)
-
-    if not descendants:
-        # No children, use section's own end line
-        return _get_section_end_line(section, file_path, file_handler)
-
-    # Find the descendant with the highest end line
-    max_end_line = _get_section_end_line(section, file_path, file_handler)
-    for desc in descendants:
-        desc_end = _get_section_end_line(desc, file_path, file_handler)
-        if desc_end > max_end_line:
-            max_end_line = desc_end
-
-    return max_end_line
+    # Issue #197: descendants are matched by both ":" (doc:section) and
+    # "." (section.subsection) separators; the index precomputes this per file
+    end_line = index.get_subtree_end_line(section)
+    if end_line is not None:
+        return end_line
+
+    # An unknown end line means the section runs to the end of its file
+    return total_lines
+
+
+# First characters of Markdown (#) and AsciiDoc (=) heading lines
+_HEADING_MARKERS = frozenset("#=")
+
+
+def _next_line_is_heading(lines: list[str], next_idx: int) -> bool:
+    """Check if the line at next_idx starts with a heading marker."""
+    if next_idx < len(lines):
+        return lines[next_idx].lstrip()[:1] in _HEADING_MARKERS
+    return False
+
+
+def _ensure_trailing_blank_line(content: str) -> str:
+    """Ensure content ends with a blank line (two newlines)."""
+    if not content.endswith("\n\n"):
+        if content.endswith("\n"):
+            return content + "\n"
+        return content + "\n\n"
+    return content
 
 # Exit codes as specified in 06_cli_specification.adoc
 EXIT_SUCCESS = 0
@@ -160,10 +159,7 @@ class AliasedGroup(click.Group):
 
     def get_command(self, ctx, cmd_name):
         """Resolve command name, checking aliases first."""
-        # Check if it's an alias
-        if cmd_name in COMMAND_ALIASES:
-            cmd_name = COMMAND_ALIASES[cmd_name]
-        return super().get_command(ctx, cmd_name)
+        return super().get_command(ctx, COMMAND_ALIASES.get(cmd_name, cmd_name))
 
     def resolve_command(self, ctx, args):
         """Resolve command with typo suggestions for unknown commands."""
@@ -183,6 +179,7 @@ class AliasedGroup(click.Group):
 
     def _get_suggestion(self, cmd_name: str) -> str | None:
         """Find similar command names using fuzzy matching."""
+        # Imported here: only needed for mistyped command names
         import difflib
 
         # Get all valid command names and aliases
@@ -238,6 +235,7 @@ class CliContext:
         verbose: bool = False,
         respect_gitignore: bool = True,
         include_hidden: bool = False,
+        use_cache: bool = True,
     ):
         self.docs_root = docs_root
         self.output_format = output_format
@@ -251,56 +249,164 @@ class CliContext:
         if not verbose:
             logging.getLogger().setLevel(logging.ERROR)
 
-        self.index = StructureIndex()
+        self.use_cache = use_cache
         self.file_handler = FileSystemHandler()
-        self.asciidoc_parser = AsciidocStructureParser(base_path=docs_root)
-        self.markdown_parser = MarkdownStructureParser()
 
-        # Build index
+    @cached_property
+    def index(self) -> StructureIndex:
+        """Structure index of the docs root, built on first access.
+
+        Deferring the build keeps ``--help`` of subcommands and usage errors
+        fast, since the group callback runs before those are handled.
+        """
+        # Imported here: the parsers are only loaded by commands using the index
+        from dacli.asciidoc_parser import AsciidocStructureParser
+        from dacli.index_builder import _build_index
+        from dacli.index_cache import default_cache_dir, get_cache_path
+        from dacli.markdown_parser import MarkdownStructureParser
+
+        index = StructureIndex()
+        asciidoc_parser = AsciidocStructureParser(base_path=self.docs_root)
+        markdown_parser = MarkdownStructureParser()
+
+        # Build index, reusing parsed documents from the cache when unchanged
+        cache_path = None
+        if self.use_cache:
+            cache_path = get_cache_path(
+                default_cache_dir(),
+                self.docs_root,
+                respect_gitignore=self.respect_gitignore,
+                include_hidden=self.include_hidden,
+            )
         _build_index(
-            docs_root,
-            self.index,
-            self.asciidoc_parser,
-            self.markdown_parser,
-            respect_gitignore=respect_gitignore,
-            include_hidden=include_hidden,
+            self.docs_root,
+            index,
+            asciidoc_parser,
+            markdown_parser,
+            respect_gitignore=self.respect_gitignore,
+            include_hidden=self.include_hidden,
+            cache_path=cache_path,
+            parallel=True,
         )
+        return index
+
+
+# Encoders are configured once; json.dumps() with non-default arguments builds
+# a fresh JSONEncoder on every call
+_JSON_ENCODER = json.JSONEncoder(default=str)
+_PRETTY_JSON_ENCODER = json.JSONEncoder(indent=2, default=str)
 
 
 def format_output(ctx: CliContext, data: dict) -> str:
     """Format output data according to the specified format."""
     if ctx.output_format == "json":
         if ctx.pretty:
-            return json.dumps(data, indent=2, default=str)
-        return json.dumps(data, default=str)
+            return _PRETTY_JSON_ENCODER.encode(data)
+        return _JSON_ENCODER.encode(data)
     elif ctx.output_format == "yaml":
         try:
-            import yaml
-            return yaml.dump(data, default_flow_style=False)
+            yaml, dumper = _get_yaml_dumper()
+            return yaml.dump(data, Dumper=dumper, default_flow_style=False)
         except ImportError:
             return json.dumps(data, indent=2, default=str)
     else:  # text
         return _format_as_text(data)
 
 
+@cache
+def _get_yaml_dumper() -> tuple[ModuleType, type]:
+    """Import PyYAML and build the dumper for yaml output.
+
+    PyYAML is imported here because it adds noticeably to the startup time of
+    every command, but only the yaml output format needs it. The dumper uses
+    libyaml's C emitter when available and, like the JSON encoders, writes
+    unknown types as strings.
+
+    Raises:
+        ImportError: If PyYAML is not installed
+    """
+    import yaml
+
+    class Dumper(getattr(yaml, "CSafeDumper", yaml.SafeDumper)):
+        pass
+
+    Dumper.add_representer(None, lambda dumper, data: dumper.represent_str(str(data)))
+    return yaml, Dumper
+
+
+def _echo_output(text: str) -> None:
+    """Write command output and a newline to stdout.
+
+    Unlike click.echo(), this does not scan the text for ANSI escape codes
+    when stdout is not a terminal or copy it to append the newline. Output
+    is formatted data, so there are no styles to strip, and section content
+    is written exactly as it appears in the document.
+    """
+    stdout = sys.stdout
+    stdout.write(text)
+    stdout.write("\n")
+    stdout.flush()
+
+
+def _echo_json_list(key: str, items: Iterable[dict], rest: dict) -> None:
+    """Write ``{key: [*items], **rest}`` as compact JSON, item by item.
+
+    The text is identical to format_output() for compact JSON, but only one
+    serialized item is held in memory at a time.
+
+    Args:
+        key: Key of the list, written first
+        items: List items, consumed lazily
+        rest: Remaining top-level keys, written after the list
+    """
+    encode = _JSON_ENCODER.encode
+    write = sys.stdout.write
+    write("{" + encode(key) + ": [")
+    separator = ""
+    for item in items:
+        write(separator)
+        write(encode(item))
+        separator = ", "
+    write("]")
+    for name, value in rest.items():
+        write(", " + encode(name) + ": " + encode(value))
+    write("}\n")
+    sys.stdout.flush()
+
+
 def _format_as_text(data: dict, indent: int = 0) -> str:
     """Format data as human-readable text."""
-    lines = []
-    prefix = "  " * indent
+    lines: list[str] = []
+    _append_text_lines(lines.append, data, "  " * indent)
+    return "\n".join(lines)
+
+
+def _append_text_lines(append: Callable[[str], None], data: dict, prefix: str) -> None:
+    """Append the text lines of data, joining them only once at the end.
+
+    Each level builds the prefix of its nested entries once; an empty nested
+    dict renders as an empty line.
+    """
+    nested_prefix = prefix + "  "
     for key, value in data.items():
         if isinstance(value, dict):
-            lines.append(f"{prefix}{key}:")
-            lines.append(_format_as_text(value, indent + 1))
+            append(f"{prefix}{key}:")
+            if value:
+                _append_text_lines(append, value, nested_prefix)
+            else:
+                append("")
         elif isinstance(value, list):
-            lines.append(f"{prefix}{key}:")
+            append(f"{prefix}{key}:")
             for item in value:
                 if isinstance(item, dict):
-                    lines.append(_format_as_text(item, indent + 1))
+                    if item:
+                        _append_text_lines(append, item, nested_prefix)
+                    else:
+                        append("")
                 else:
-                    lines.append(f"{prefix}  - {item}")
+                    append(f"{prefix}  - {item}")
         else:
-            lines.append(f"{prefix}{key}: {value}")
-    return "\n".join(lines)
+            append(f"{prefix}{key}: {value}")
 
 
 pass_context = click.make_pass_decorator(CliContext)
@@ -353,6 +459,12 @@ Examples:
     default=False,
     help="Include files in hidden directories (starting with '.')",
 )
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    default=False,
+    help="Parse all documents instead of reusing the on-disk index cache",
+)
 @click.version_option(version=__version__, prog_name="dacli")
 @click.pass_context
 def cli(
@@ -363,6 +475,7 @@ def cli(
     verbose: bool,
     no_gitignore: bool,
     include_hidden: bool,
+    no_cache: bool,
 ):
     """dacli - Docs-As-Code CLI.
 
@@ -376,6 +489,7 @@ def cli(
         verbose,
         respect_gitignore=not no_gitignore,
         include_hidden=include_hidden,
+        use_cache=not no_cache,
     )
 
 
@@ -390,7 +504,7 @@ Examples:
 def structure(ctx: CliContext, max_depth: int | None):
     """Get the hierarchical document structure."""
     result = ctx.index.get_structure(max_depth)
-    click.echo(format_output(ctx, result))
+    _echo_output(format_output(ctx, result))
 
 
 @cli.command(epilog="""
@@ -433,19 +547,18 @@ def section(ctx: CliContext, path: str):
                 "details": error_details,
             }
         }
-        click.echo(format_output(ctx, result))
+        _echo_output(format_output(ctx, result))
         sys.exit(EXIT_PATH_NOT_FOUND)
 
     try:
-        file_content = ctx.file_handler.read_file(section_obj.source_location.file)
-        lines = file_content.splitlines()
-
-        start_line = section_obj.source_location.line - 1
+        file_path = section_obj.source_location.file
         end_line = section_obj.source_location.end_line
         if end_line is None:
-            end_line = len(lines)
+            end_line = ctx.file_handler.count_lines(file_path)
 
-        content = "\n".join(lines[start_line:end_line])
+        content = ctx.file_handler.read_section(
+            file_path, section_obj.source_location.line, end_line
+        )
 
         file_ext = section_obj.source_location.file.suffix.lower()
         doc_format = "asciidoc" if file_ext in (".adoc", ".asciidoc") else "markdown"
@@ -461,9 +574,9 @@ def section(ctx: CliContext, path: str):
             },
             "format": doc_format,
         }
-        click.echo(format_output(ctx, result))
+        _echo_output(format_output(ctx, result))
     except FileReadError as e:
-        click.echo(format_output(ctx, {"error": f"Failed to read section: {e}"}))
+        _echo_output(format_output(ctx, {"error": f"Failed to read section: {e}"}))
         sys.exit(EXIT_ERROR)
 
 
@@ -497,7 +610,7 @@ def sections_at_level(ctx: CliContext, level: int):
         "sections": [{"path": s.path, "title": s.title} for s in sections],
         "count": len(sections),
     }
-    click.echo(format_output(ctx, result))
+    _echo_output(format_output(ctx, result))
 
 
 @cli.command(epilog="""
@@ -540,7 +653,7 @@ def search(ctx: CliContext, query: str, scope: str | None, max_results: int):
         ],
         "total_results": len(results),
     }
-    click.echo(format_output(ctx, result))
+    _echo_output(format_output(ctx, result))
 
 
 @cli.command(epilog="""
@@ -572,38 +685,22 @@ def elements(ctx: CliContext, section_path: str | None, element_type: str | None
     )
 
     # Build element dicts with optional content (Issue #159)
-    element_dicts = []
-    for e in elems:
-        elem_dict = {
-            "type": e.type,
-            "parent_section": e.parent_section,
-            "location": {
-                "file": str(e.source_location.file),
-                "start_line": e.source_location.line,
-                "end_line": e.source_location.end_line,
-            },
-        }
-
-        # Include attributes if requested (Issue #159)
-        if include_content:
-            attributes = dict(e.attributes)  # Copy attributes
-
-            # Apply content limit if specified
-            if content_limit is not None and "content" in attributes:
-                content = attributes["content"]
-                lines = content.split("\n")
-                if len(lines) > content_limit:
-                    attributes["content"] = "\n".join(lines[:content_limit])
-
-            elem_dict["attributes"] = attributes
+    file_names: dict[Path, str] = {}
+    element_dicts = (
+        element_to_dict(e, include_content, content_limit, file_names) for e in elems
+    )
 
-        element_dicts.append(elem_dict)
+    if ctx.output_format == "json" and not ctx.pretty:
+        # Element lists can be large (especially with content), so write them
+        # one element at a time instead of building the whole document first
+        _echo_json_list("elements", element_dicts, {"count": len(elems)})
+        return
 
     result = {
-        "elements": element_dicts,
-        "count": len(element_dicts),
+        "elements": list(element_dicts),
+        "count": len(elems),
     }
-    click.echo(format_output(ctx, result))
+    _echo_output(format_output(ctx, result))
 
 
 @cli.command(epilog="""
@@ -621,9 +718,9 @@ def metadata(ctx: CliContext, path: str | None):
     else:
         result = get_section_metadata(ctx.index, path)
         if "error" in result:
-            click.echo(format_output(ctx, result))
+            _echo_output(format_output(ctx, result))
             sys.exit(EXIT_PATH_NOT_FOUND)
-    click.echo(format_output(ctx, result))
+    _echo_output(format_output(ctx, result))
 
 
 @cli.command(epilog="""
@@ -635,7 +732,7 @@ Examples:
 def validate(ctx: CliContext):
     """Validate the document structure."""
     result = service_validate_structure(ctx.index, ctx.docs_root)
-    click.echo(format_output(ctx, result))
+    _echo_output(format_output(ctx, result))
 
     if not result["valid"]:
         sys.exit(EXIT_VALIDATION_ERROR)
@@ -664,7 +761,7 @@ def update(ctx: CliContext, path: str, content: str, no_preserve_title: bool,
         preserve_title=not no_preserve_title,
         expected_hash=expected_hash,
     )
-    click.echo(format_output(ctx, result))
+    _echo_output(format_output(ctx, result))
 
     if not result.get("success", False):
         if "not found" in result.get("error", ""):
@@ -688,12 +785,11 @@ def insert(ctx: CliContext, path: str, position: str, content: str):
     section_obj = ctx.index.get_section(normalized_path)
     if section_obj is None:
         result = {"success": False, "error": f"Section '{normalized_path}' not found"}
-        click.echo(format_output(ctx, result))
+        _echo_output(format_output(ctx, result))
         sys.exit(EXIT_PATH_NOT_FOUND)
 
     file_path = section_obj.source_location.file
     start_line = section_obj.source_location.line
-    end_line = _get_section_end_line(section_obj, file_path, ctx.file_handler)
 
     # Process content: read from stdin if "-", otherwise process escape sequences
     if content == "-":
@@ -708,32 +804,23 @@ def insert(ctx: CliContext, path: str, position: str, content: str):
         previous_hash = compute_hash(file_content)
         lines = file_content.splitlines(keepends=True)
 
+        # A section without a known end line runs to the end of the file; use
+        # the lines read above instead of reading the file a second time
+        end_line = section_obj.source_location.end_line
+        if end_line is None:
+            end_line = len(lines)
+
         # Ensure blank line before headings when inserting after content
         stripped_insert = insert_content.lstrip()
-        starts_with_heading = stripped_insert.startswith("#") or stripped_insert.startswith("=")
-
-        def next_line_is_heading(lines: list, next_idx: int) -> bool:
-            """Check if the line at next_idx starts with a heading marker."""
-            if next_idx < len(lines):
-                next_line = lines[next_idx].lstrip()
-                return next_line.startswith("#") or next_line.startswith("=")
-            return False
-
-        def ensure_trailing_blank_line(content: str) -> str:
-            """Ensure content ends with a blank line (two newlines)."""
-            if not content.endswith("\n\n"):
-                if content.endswith("\n"):
-                    return content + "\n"
-                return content + "\n\n"
-            return content
+        starts_with_heading = stripped_insert[:1] in _HEADING_MARKERS
 
         if position == "before":
             insert_line = start_line
             # Check if the line we're inserting before is a heading
             next_line_idx = start_line - 1  # 0-based index
-            if next_line_is_heading(lines, next_line_idx) and not starts_with_heading:
-                insert_content = ensure_trailing_blank_line(insert_content)
-            new_lines = lines[: start_line - 1] + [insert_content] + lines[start_line - 1 :]
+            if _next_line_is_heading(lines, next_line_idx) and not starts_with_heading:
+                insert_content = _ensure_trailing_blank_line(insert_content)
+            insert_index = start_line - 1
         elif position == "after":
             insert_line = end_line + 1
             # Add blank line before headings if previous line is not blank
@@ -744,11 +831,11 @@ def insert(ctx: CliContext, path: str, position: str, content: str):
             # Add blank line after content if next line is a heading
             # 0-based index (end_line is 1-based, so lines[end_line] is the next line)
             next_line_idx = end_line
-            if next_line_is_heading(lines, next_line_idx) and not starts_with_heading:
-                insert_content = ensure_trailing_blank_line(insert_content)
-            new_lines = lines[:end_line] + [insert_content] + lines[end_line:]
+            if _next_line_is_heading(lines, next_line_idx) and not starts_with_heading:
+                insert_content = _ensure_trailing_blank_line(insert_content)
+            insert_index = end_line
         else:  # append - insert after all descendants
-            append_line = _get_section_append_line(section_obj, ctx.index, ctx.file_handler)
+            append_line = _get_section_append_line(section_obj, ctx.index, len(lines))
             insert_line = append_line + 1
             # Add blank line before headings if previous line is not blank
             if starts_with_heading and append_line > 0:
@@ -757,11 +844,13 @@ def insert(ctx: CliContext, path: str, position: str, content: str):
                     insert_content = "\n" + insert_content
             # Add blank line after content if next line is a heading
             next_line_idx = append_line  # 0-based index
-            if next_line_is_heading(lines, next_line_idx) and not starts_with_heading:
-                insert_content = ensure_trailing_blank_line(insert_content)
-            new_lines = lines[:append_line] + [insert_content] + lines[append_line:]
+            if _next_line_is_heading(lines, next_line_idx) and not starts_with_heading:
+                insert_content = _ensure_trailing_blank_line(insert_content)
+            insert_index = append_line
 
-        new_file_content = "".join(new_lines)
+        # Insert in place instead of concatenating slices into a new list
+        lines.insert(insert_index, insert_content)
+        new_file_content = "".join(lines)
         new_hash = compute_hash(new_file_content)
 
         ctx.file_handler.write_file(file_path, new_file_content)
@@ -772,10 +861,10 @@ def insert(ctx: CliContext, path: str, position: str, content: str):
             "previous_hash": previous_hash,
             "new_hash": new_hash,
         }
-        click.echo(format_output(ctx, result))
+        _echo_output(format_output(ctx, result))
     except (FileReadError, FileWriteError) as e:
         result = {"success": False, "error": f"Failed to insert: {e}"}
-        click.echo(format_output(ctx, result))
+        _echo_output(format_output(ctx, result))
         sys.exit(EXIT_WRITE_ERROR)
 
 
@@ -4,17 +4,95 @@ Implements ADR-004: Atomic Writes via Temporary Files.
 
 This module provides safe file operations with:
 - UTF-8 encoding with proper error handling
-- Atomic writes using backup-and-replace strategy
+- Atomic writes using temp-file-and-replace strategy
 - Line-based operations for section updates
 """
 
 import logging
 import os
 import shutil
+import time
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Files modified more recently than this are not cached by read_file: a second
+# change within the same timestamp tick could keep mtime and size unchanged
+_RACY_WINDOW_NS = 2_000_000_000
+
+# Number of files whose content read_file keeps; the least recently read file
+# is dropped first, so a long-running server does not hold every file it saw
+_READ_CACHE_SIZE = 64
+
+
+def _read_text(path: Path) -> str:
+    """Read a file as UTF-8 text with universal newlines, like Path.read_text().
+
+    The file is read with a single os.read() sized by fstat() and decoded in
+    one step, which avoids the chunked reads of a text-mode file object.
+    """
+    # O_BINARY: on Windows a text-mode descriptor would translate CRLF and stop
+    # at a Ctrl-Z byte
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        chunks = [os.read(fd, os.fstat(fd).st_size)]
+        # The file may have grown since fstat(); read on until EOF
+        while chunk := os.read(fd, 65536):
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    content = b"".join(chunks).decode("utf-8")
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
+
+
+def _write_text(path: Path, content: str, durable: bool) -> None:
+    """Write text as UTF-8, like Path.write_text(), optionally fsync'ed.
+
+    The content is encoded once and written with os.write() calls on a raw
+    file descriptor, which avoids the buffering of a text-mode file object.
+    """
+    if os.linesep != "\n":
+        # Keep the newline translation of text mode
+        content = content.replace("\n", os.linesep)
+    data = memoryview(content.encode("utf-8"))
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o666)
+    try:
+        while data:
+            data = data[os.write(fd, data) :]
+        if durable:
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _fsync_directory(directory: Path) -> None:
+    """Flush a directory entry to disk, so that a rename into it survives a crash.
+
+    Windows cannot open a directory as a file descriptor and commits the
+    rename itself, so this is a no-op there.
+    """
+    if os.name == "nt":
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _check_line_range(start_line: int, end_line: int) -> None:
+    """Validate a 1-based, inclusive line range.
+
+    Raises:
+        ValueError: If start_line is below 1 or after end_line
+    """
+    if start_line < 1:
+        raise ValueError("Start line must be >= 1 (1-based indexing)")
+    if end_line < start_line:
+        raise ValueError(f"Start line ({start_line}) must be <= end line ({end_line})")
+
 
 class FileReadError(Exception):
     """Error during file read operation.
@@ -39,20 +117,34 @@ class FileWriteError(Exception):
 class FileSystemHandler:
     """Handler for atomic file system operations.
 
-    Implements ADR-004 backup-and-replace strategy for atomic writes:
-    1. Create backup of original file (.bak)
-    2. Write changes to temporary file (.tmp)
-    3. Atomically rename temp file to original
-    4. Delete backup file
-    5. On failure: restore from backup, cleanup temp files
+    Implements ADR-004 temp-file-and-replace strategy for atomic writes:
+    1. Write changes to temporary file (.tmp)
+    2. Atomically rename temp file to original
+    3. On failure: cleanup temp files, the original stays untouched
+
+    Reads are cached per path and revalidated by modification time and size,
+    so repeated reads of an unchanged file do not touch its content again.
+    The cache holds the most recently read files only.
+    The split lines of cached content are kept as well, so reading a section
+    only slices the lines it spans.
 
     Note: This class is not thread-safe for concurrent access to the
     same file. Use external locking if concurrent access is needed.
     """
 
+    def __init__(self) -> None:
+        """Initialize the handler with an empty read cache."""
+        # path -> ((st_mtime_ns, st_size), content)
+        self._read_cache: dict[Path, tuple[tuple[int, int], str]] = {}
+        # path -> (content, content.splitlines())
+        self._lines_cache: dict[Path, tuple[str, list[str]]] = {}
+
     def read_file(self, path: Path | str) -> str:
         """Read entire file content as UTF-8 string.
 
+        Content is served from the read cache while the file's modification
+        time and size are unchanged.
+
         Args:
             path: Path to the file
 
@@ -64,11 +156,23 @@ class FileSystemHandler:
         """
         path = Path(path)
 
-        if not path.exists():
-            raise FileReadError(f"File not found: {path}")
+        try:
+            stat = path.stat()
+        except (FileNotFoundError, NotADirectoryError) as e:
+            raise FileReadError(f"File not found: {path}") from e
+        except PermissionError as e:
+            raise FileReadError(f"Permission denied reading file: {path}") from e
+        except OSError as e:
+            raise FileReadError(f"Error reading file {path}: {e}") from e
+
+        cache_key = (stat.st_mtime_ns, stat.st_size)
+        cached = self._read_cache.pop(path, None)
+        if cached is not None and cached[0] == cache_key:
+            self._read_cache[path] = cached  # move to most recently used
+            return cached[1]
 
         try:
-            return path.read_text(encoding="utf-8")
+            content = _read_text(path)
         except PermissionError as e:
             raise FileReadError(f"Permission denied reading file: {path}") from e
         except UnicodeDecodeError as e:
@@ -78,6 +182,14 @@ class FileSystemHandler:
         except OSError as e:
             raise FileReadError(f"Error reading file {path}: {e}") from e
 
+        if time.time_ns() - stat.st_mtime_ns > _RACY_WINDOW_NS:
+            self._read_cache[path] = (cache_key, content)
+            if len(self._read_cache) > _READ_CACHE_SIZE:
+                oldest = next(iter(self._read_cache))
+                del self._read_cache[oldest]
+                self._lines_cache.pop(oldest, None)
+        return content
+
     def read_lines(
         self, path: Path | str, start: int, end: int
     ) -> list[str]:
@@ -98,10 +210,7 @@ class FileSystemHandler:
         path = Path(path)
 
         # Validate parameters
-        if start < 1:
-            raise ValueError("Start line must be >= 1 (1-based indexing)")
-        if end < start:
-            raise ValueError(f"Start line ({start}) must be <= end line ({end})")
+        _check_line_range(start, end)
 
         # Read all lines
         content = self.read_file(path)
@@ -116,19 +225,76 @@ class FileSystemHandler:
         # Convert to 0-based index and extract range
         return lines[start - 1 : end]
 
-    def write_file(self, path: Path | str, content: str) -> None:
-        """Write content to file atomically using backup-and-replace.
+    def count_lines(self, path: Path | str) -> int:
+        """Count the lines of a file as ``str.splitlines()`` does.
+
+        Args:
+            path: Path to the file
+
+        Returns:
+            Number of lines
+
+        Raises:
+            FileReadError: If file cannot be read
+        """
+        return len(self._get_lines(Path(path)))
+
+    def read_section(self, path: Path | str, start_line: int, end_line: int) -> str:
+        """Read a range of lines joined with newlines.
+
+        Args:
+            path: Path to the file
+            start_line: Start line number (1-based, inclusive)
+            end_line: End line number (1-based, inclusive); clipped to the file
+
+        Returns:
+            Text of the lines, without a trailing newline
+
+        Raises:
+            FileReadError: If file cannot be read
+        """
+        return "\n".join(self._get_lines(Path(path))[start_line - 1 : end_line])
+
+    def _get_lines(self, path: Path) -> list[str]:
+        """Get the lines of a file, reusing the split of cached content."""
+        content = self.read_file(path)
+        cached = self._lines_cache.get(path)
+        if cached is not None and cached[0] is content:
+            return cached[1]
+
+        lines = content.splitlines()
+        if self._read_cache.get(path, (None, None))[1] is content:
+            self._lines_cache[path] = (content, lines)
+        else:
+            self._lines_cache.pop(path, None)
+        return lines
+
+    def write_file(
+        self,
+        path: Path | str,
+        content: str,
+        keep_backup: bool = False,
+        durable: bool = False,
+    ) -> None:
+        """Write content to file atomically using temp-file-and-replace.
 
         Implements ADR-004 atomic write strategy:
-        1. If file exists, create backup (.bak)
-        2. Write content to temporary file (.tmp)
-        3. Atomically rename temp to target
-        4. Delete backup
-        5. On error: restore backup, cleanup temp
+        1. Write content to temporary file (.tmp)
+        2. Atomically rename temp to target
+        3. On error: cleanup temp; the original file is untouched
+
+        The original is only ever replaced by the atomic rename, so no copy
+        of it is needed to restore it after a failure.
 
         Args:
             path: Path to the file
             content: Content to write
+            keep_backup: If True, keep the previous version of an existing
+                file as ``<name>.bak``. The backup is a hard link to the old
+                content, so no data is copied where links are supported.
+            durable: If True, flush the new content to disk with fsync()
+                before it replaces the original, and on POSIX also fsync the
+                parent directory after the replace so the rename is durable
 
         Raises:
             FileWriteError: If write operation fails
@@ -136,22 +302,18 @@ class FileSystemHandler:
         path = Path(path)
         backup_path = path.with_suffix(path.suffix + ".bak")
         temp_path = path.with_suffix(path.suffix + ".tmp")
+        self._read_cache.pop(path, None)
+        self._lines_cache.pop(path, None)
 
         # Track what we've created for cleanup
         backup_created = False
         temp_created = False
 
         try:
-            # Step 1: Create backup if original exists
-            if path.exists():
-                shutil.copy2(path, backup_path)
-                backup_created = True
-                logger.debug(f"Created backup: {backup_path}")
-
-            # Step 2: Write to temporary file
+            # Step 1: Write to temporary file
             try:
-                temp_path.write_text(content, encoding="utf-8")
                 temp_created = True
+                _write_text(temp_path, content, durable)
                 logger.debug(f"Wrote temp file: {temp_path}")
             except PermissionError as e:
                 raise FileWriteError(
@@ -160,7 +322,21 @@ class FileSystemHandler:
             except OSError as e:
                 raise FileWriteError(f"Error writing temp file {temp_path}: {e}") from e
 
-            # Step 3: Atomic rename (replace original)
+            # Optional: keep the previous version next to the file
+            if keep_backup and path.exists():
+                try:
+                    backup_path.unlink(missing_ok=True)
+                    try:
+                        os.link(path, backup_path)
+                    except OSError:
+                        # File system without hard links
+                        shutil.copy2(path, backup_path)
+                    backup_created = True
+                    logger.debug(f"Created backup: {backup_path}")
+                except OSError as e:
+                    raise FileWriteError(f"Error creating backup {backup_path}: {e}") from e
+
+            # Step 2: Atomic rename (replace original)
             try:
                 # os.replace provides atomic file replacement on POSIX and Windows
                 os.replace(temp_path, path)
@@ -171,32 +347,26 @@ class FileSystemHandler:
                     f"Error during atomic replace of {path}: {e}"
                 ) from e
 
-            # Step 4: Delete backup (success path)
-            if backup_created:
+            # Step 3: Make the rename itself durable
+            if durable:
+                # The new content is in place; a backup is no longer a leftover
+                backup_created = False
                 try:
-                    backup_path.unlink()
-                    backup_created = False
-                    logger.debug(f"Deleted backup: {backup_path}")
+                    _fsync_directory(path.parent)
                 except OSError as e:
-                    # Non-fatal: backup remains but operation succeeded
-                    logger.warning(f"Could not delete backup {backup_path}: {e}")
+                    raise FileWriteError(f"Error syncing directory of {path}: {e}") from e
 
         except FileWriteError:
             # Re-raise FileWriteError after cleanup
-            self._cleanup_on_error(
-                path, backup_path, temp_path, backup_created, temp_created
-            )
+            self._cleanup_on_error(backup_path, temp_path, backup_created, temp_created)
             raise
         except Exception as e:
             # Unexpected error - cleanup and wrap
-            self._cleanup_on_error(
-                path, backup_path, temp_path, backup_created, temp_created
-            )
+            self._cleanup_on_error(backup_path, temp_path, backup_created, temp_created)
             raise FileWriteError(f"Unexpected error writing {path}: {e}") from e
 
     def _cleanup_on_error(
         self,
-        path: Path,
         backup_path: Path,
         temp_path: Path,
         backup_created: bool,
@@ -204,28 +374,16 @@ class FileSystemHandler:
     ) -> None:
         """Cleanup after a failed write operation.
 
-        Restores original from backup if available, removes temp files.
+        Removes the temp file and a backup created by this write. The
+        original file is never modified before the final atomic replace.
         """
-        # Remove temp file if it exists
-        if temp_created and temp_path.exists():
-            try:
-                temp_path.unlink()
-                logger.debug(f"Cleaned up temp file: {temp_path}")
-            except OSError as e:
-                logger.warning(f"Could not cleanup temp file {temp_path}: {e}")
-
-        # Restore from backup if we have one
-        if backup_created and backup_path.exists():
-            try:
-                # If original was corrupted/deleted, restore it
-                if not path.exists():
-                    shutil.copy2(backup_path, path)
-                    logger.debug(f"Restored {path} from backup")
-                # Remove backup
-                backup_path.unlink()
-                logger.debug(f"Cleaned up backup: {backup_path}")
-            except OSError as e:
-                logger.warning(f"Could not restore from backup {backup_path}: {e}")
+        for created, leftover in ((temp_created, temp_path), (backup_created, backup_path)):
+            if created and leftover.exists():
+                try:
+                    leftover.unlink()
+                    logger.debug(f"Cleaned up {leftover}")
+                except OSError as e:
+                    logger.warning(f"Could not cleanup {leftover}: {e}")
 
     def update_section(
         self,
@@ -233,6 +391,7 @@ class FileSystemHandler:
         start_line: int,
         end_line: int,
         new_content: str,
+        durable: bool = False,
     ) -> None:
         """Update a line range in a file atomically.
 
@@ -244,6 +403,8 @@ class FileSystemHandler:
             start_line: First line to replace (1-based)
             end_line: Last line to replace (1-based, inclusive)
             new_content: Content to insert (should include newlines)
+            durable: If True, fsync the new content before replacing the file
+                and, on POSIX, the parent directory after replacing it
 
         Raises:
             FileReadError: If file cannot be read
@@ -252,14 +413,46 @@ class FileSystemHandler:
         """
         path = Path(path)
 
+        # Validate parameters before touching the file
+        _check_line_range(start_line, end_line)
+
+        self.update_section_with_content(
+            path, self.read_file(path), start_line, end_line, new_content, durable=durable
+        )
+
+    def update_section_with_content(
+        self,
+        path: Path | str,
+        content: str,
+        start_line: int,
+        end_line: int,
+        new_content: str,
+        durable: bool = False,
+    ) -> None:
+        """Update a line range in a file whose content was already read.
+
+        Same as update_section(), but splices into the given content instead
+        of reading the file again. Callers that read the file beforehand (for
+        example to hash it for optimistic locking) pass that content here.
+
+        Args:
+            path: Path to the file
+            content: Current content of the file, as returned by read_file()
+            start_line: First line to replace (1-based)
+            end_line: Last line to replace (1-based, inclusive)
+            new_content: Content to insert (should include newlines)
+            durable: If True, fsync the new content before replacing the file
+                and, on POSIX, the parent directory after replacing it
+
+        Raises:
+            FileWriteError: If file cannot be written
+            ValueError: If line range is invalid
+        """
+        path = Path(path)
+
         # Validate parameters
-        if start_line < 1:
-            raise ValueError("Start line must be >= 1 (1-based indexing)")
-        if end_line < start_line:
-            raise ValueError(f"Start line ({start_line}) must be <= end line ({end_line})")
+        _check_line_range(start_line, end_line)
 
-        # Read current content
-        content = self.read_file(path)
         lines = content.splitlines(keepends=True)
 
         # Handle file without trailing newline
@@ -284,4 +477,4 @@ class FileSystemHandler:
 
         # Join and write
         new_file_content = "".join(new_lines)
-        self.write_file(path, new_file_content)
+        self.write_file(path, new_file_content, durable=durable)
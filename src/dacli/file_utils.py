@@ -4,7 +4,9 @@ This module provides utilities for scanning documentation files while
 respecting .gitignore patterns and filtering out hidden directories.
 """
 
-from collections.abc import Iterator
+import fnmatch
+import os
+from collections.abc import Callable, Iterator
 from pathlib import Path
 
 import pathspec
@@ -33,41 +35,25 @@ def load_gitignore_spec(docs_root: Path) -> pathspec.PathSpec | None:
         return None
 
 
-def _is_hidden_path(path: Path, root: Path) -> bool:
-    """Check if any component of the path (relative to root) starts with a dot.
-
-    Args:
-        path: Path to check
-        root: Root directory to calculate relative path from
-
-    Returns:
-        True if any path component starts with '.'
-    """
-    try:
-        relative = path.relative_to(root)
-        return any(part.startswith(".") for part in relative.parts)
-    except ValueError:
-        # Path is not relative to root
-        return False
-
-
 def find_doc_files(
     docs_root: Path,
-    pattern: str,
-    *,
+    *patterns: str,
     respect_gitignore: bool = True,
     include_hidden: bool = False,
 ) -> Iterator[Path]:
     """Find documentation files matching a pattern, respecting gitignore.
 
     This function scans a directory recursively for files matching the given
-    pattern (e.g., "*.adoc" or "*.md") while:
+    patterns (e.g., "*.adoc" or "*.md") while:
     - Respecting .gitignore patterns (when respect_gitignore=True)
     - Skipping hidden directories (when include_hidden=False)
 
+    Several patterns are matched in a single pass over the tree. Files are
+    yielded in the same order as ``docs_root.rglob(pattern)``.
+
     Args:
         docs_root: Root directory to scan
-        pattern: Glob pattern for files (e.g., "*.adoc", "*.md")
+        *patterns: Glob patterns for file names (e.g., "*.adoc", "*.md")
         respect_gitignore: If True, exclude files matching .gitignore patterns
         include_hidden: If True, include files in hidden directories
 
@@ -77,54 +63,83 @@ def find_doc_files(
     # Load gitignore spec if requested
     gitignore_spec = load_gitignore_spec(docs_root) if respect_gitignore else None
 
-    # Scan for files
-    for file_path in docs_root.rglob(pattern):
-        # Skip hidden directories unless explicitly included
-        if not include_hidden and _is_hidden_path(file_path, docs_root):
+    def is_excluded_dir(directory: Path) -> bool:
+        # Hidden or gitignored directories are not walked, which also
+        # excludes everything below them
+        if not include_hidden and directory.name.startswith("."):
+            return True
+        if gitignore_spec is None:
+            return False
+        relative_dir = str(directory.relative_to(docs_root))
+        return gitignore_spec.match_file(relative_dir + "/") or gitignore_spec.match_file(
+            relative_dir
+        )
+
+    # Scan for files. Parent directories were already checked by
+    # is_excluded_dir(), so only the file itself needs to be tested.
+    for file_path in _scan_tree(docs_root, patterns, is_excluded_dir):
+        # Skip hidden files unless explicitly included
+        if not include_hidden and file_path.name.startswith("."):
             continue
 
         # Skip gitignored files
-        if gitignore_spec is not None:
-            try:
-                relative_path = file_path.relative_to(docs_root)
-                # Check both the file path and parent directories
-                if _matches_gitignore(relative_path, gitignore_spec):
-                    continue
-            except ValueError:
-                # Path is not relative to docs_root, skip gitignore check
-                pass
+        if gitignore_spec is not None and gitignore_spec.match_file(
+            str(file_path.relative_to(docs_root))
+        ):
+            continue
 
         yield file_path
 
 
-def _matches_gitignore(relative_path: Path, spec: pathspec.PathSpec) -> bool:
-    """Check if a path matches gitignore patterns.
+def _scan_tree(
+    root: Path,
+    patterns: tuple[str, ...],
+    is_excluded_dir: Callable[[Path], bool] | None = None,
+) -> Iterator[Path]:
+    """Yield entries below root whose names match any of the patterns.
 
-    This checks the path and all parent directories against the gitignore spec.
+    Mirrors the traversal of ``Path.rglob()``: the entries of a directory's
+    subdirectories are listed right after the directory itself is walked,
+    and symlinked directories are not followed. Unlike separate rglob()
+    calls per pattern, every directory is scanned exactly once.
 
     Args:
-        relative_path: Path relative to the docs root
-        spec: PathSpec object with gitignore patterns
+        root: Directory to scan
+        patterns: Glob patterns for entry names
+        is_excluded_dir: Optional predicate for subdirectories that must not
+            be descended into
 
-    Returns:
-        True if the path should be ignored
+    Yields:
+        Paths of matching entries
     """
-    path_str = str(relative_path)
-
-    # Check the file itself
-    if spec.match_file(path_str):
-        return True
 
-    # Check parent directories (for patterns like "node_modules/")
-    for parent in relative_path.parents:
-        if parent == Path("."):
-            continue
-        # Add trailing slash to match directory patterns
-        dir_path = str(parent) + "/"
-        if spec.match_file(dir_path):
-            return True
-        # Also check without trailing slash
-        if spec.match_file(str(parent)):
-            return True
-
-    return False
+    def scan(directory: Path) -> list[os.DirEntry]:
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            return []
+        for entry in entries:
+            if any(fnmatch.fnmatch(entry.name, pattern) for pattern in patterns):
+                matches.append(directory / entry.name)
+        return entries
+
+    matches: list[Path] = []
+    stack = [(root, scan(root))]
+    yield from matches
+    while stack:
+        directory, entries = stack.pop()
+        subdirs = []
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                is_dir = False
+            if is_dir:
+                subdir = directory / entry.name
+                if is_excluded_dir is not None and is_excluded_dir(subdir):
+                    continue
+                matches.clear()
+                subdirs.append((subdir, scan(subdir)))
+                yield from matches
+        stack += reversed(subdirs)
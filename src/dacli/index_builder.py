@@ -0,0 +1,259 @@
+"""Building the structure index from a docs root.
+
+Finds the AsciiDoc and Markdown documents below a docs root, parses them
+(optionally in a process pool for large document sets) and fills a StructureIndex.
+Shared by the MCP server and the CLI; kept separate from the MCP app so the
+CLI does not have to import the MCP server framework.
+"""
+
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+from dacli.asciidoc_parser import (
+    AsciidocDocument,
+    AsciidocStructureParser,
+    parse_asciidoc_file,
+)
+from dacli.file_utils import find_doc_files
+from dacli.index_cache import load_documents, load_unchanged_documents, save_documents
+from dacli.markdown_parser import (
+    MarkdownDocument,
+    MarkdownStructureParser,
+    parse_markdown_file,
+)
+from dacli.models import Document
+from dacli.structure_index import StructureIndex
+
+logger = logging.getLogger(__name__)
+
+# Below this many bytes of source to parse, a process pool is slower than
+# parsing serially: starting spawn workers costs about 0.25 s, the parsers
+# handle 2-8 MB/s of chapter-sized documents, and the parent still unpickles
+# every result (10-20% of the parse time). scripts/benchmark_parallel_parse.py
+# puts the break-even at about 5-7 MB of source with 2 workers and 2-4 MB with
+# 4 or more.
+PARALLEL_PARSE_MIN_BYTES = 8_000_000
+
+
+def _build_index(
+    docs_root: Path,
+    index: StructureIndex,
+    asciidoc_parser: AsciidocStructureParser,
+    markdown_parser: MarkdownStructureParser,
+    *,
+    respect_gitignore: bool = True,
+    include_hidden: bool = False,
+    cache_path: Path | None = None,
+    parallel: bool = False,
+) -> None:
+    """Build the structure index from documents in docs_root.
+
+    Args:
+        docs_root: Root directory containing documentation
+        index: StructureIndex to populate
+        asciidoc_parser: Parser for AsciiDoc files
+        markdown_parser: Parser for Markdown files
+        respect_gitignore: If True, exclude files matching .gitignore patterns
+        include_hidden: If True, include files in hidden directories
+        cache_path: Optional index cache file; parsed documents are loaded from
+            it when no source file has changed, and stored in it otherwise
+            (unchanged documents are reused instead of parsed again)
+        parallel: If True, large document sets are parsed in a process pool.
+            Meant for one-shot builds such as a CLI run; the MCP server
+            rebuilds after every write and would start a new pool each time.
+    """
+    # Find all AsciiDoc files first (Issue #184), walking the tree only once
+    doc_files = list(
+        find_doc_files(
+            docs_root,
+            "*.adoc",
+            "*.md",
+            respect_gitignore=respect_gitignore,
+            include_hidden=include_hidden,
+        )
+    )
+    all_adoc_files = [f for f in doc_files if f.name.endswith(".adoc")]
+    md_files = [f for f in doc_files if f.name.endswith(".md")]
+
+    documents = None
+    cached: dict[Path, Document] = {}
+    if cache_path is not None:
+        documents = load_documents(cache_path, all_adoc_files + md_files)
+        if documents is None:
+            cached = load_unchanged_documents(cache_path)
+    if documents is None:
+        documents = _parse_documents(
+            all_adoc_files,
+            md_files,
+            asciidoc_parser,
+            markdown_parser,
+            cached=cached,
+            parallel=parallel,
+        )
+        if cache_path is not None:
+            save_documents(cache_path, all_adoc_files + md_files, documents)
+
+    # Build index
+    warnings = index.build_from_documents(documents)
+    for warning in warnings:
+        logger.warning("Index: %s", warning)
+
+
+def _parse_documents(
+    all_adoc_files: list[Path],
+    md_files: list[Path],
+    asciidoc_parser: AsciidocStructureParser,
+    markdown_parser: MarkdownStructureParser,
+    *,
+    cached: dict[Path, Document] | None = None,
+    parallel: bool = False,
+) -> list[Document]:
+    """Parse the root AsciiDoc documents and all Markdown files.
+
+    Args:
+        all_adoc_files: All AsciiDoc files found in the docs root
+        md_files: All Markdown files found in the docs root
+        asciidoc_parser: Parser for AsciiDoc files
+        markdown_parser: Parser for Markdown files
+        cached: Previously parsed documents by file path that are known to be
+            unchanged; these files are not parsed again
+        parallel: If True, large sets of files are parsed in a process pool
+
+    Returns:
+        Parsed documents; files that fail to parse are logged and skipped
+    """
+    documents: list[Document] = []
+
+    # Scan for include directives to identify included files (Issue #184)
+    # Included files should not be parsed as separate root documents
+    included_files: set[Path] = set()
+    for adoc_file in all_adoc_files:
+        included_files.update(AsciidocStructureParser.scan_includes(adoc_file))
+
+    # Filter: only parse files that are NOT included by others (Issue #184)
+    root_adoc_files = [f for f in all_adoc_files if f not in included_files]
+
+    logger.info(
+        f"Found {len(all_adoc_files)} AsciiDoc files, "
+        f"{len(included_files)} included, "
+        f"{len(root_adoc_files)} root documents"
+    )
+
+    # Parse root AsciiDoc files only, plus all Markdown files
+    cached = cached or {}
+    files = root_adoc_files + md_files
+    parse_results = iter(
+        _parse_files(
+            [f for f in root_adoc_files if f not in cached],
+            [f for f in md_files if f not in cached],
+            asciidoc_parser,
+            markdown_parser,
+            parallel=parallel,
+        )
+    )
+    for file_path in files:
+        result = cached[file_path] if file_path in cached else next(parse_results)
+        if isinstance(result, Exception):
+            # Log but continue with other files
+            logger.warning("Failed to parse %s: %s", file_path, result)
+        elif isinstance(result, MarkdownDocument):
+            # Convert MarkdownDocument to Document
+            documents.append(
+                Document(
+                    file_path=result.file_path,
+                    title=result.title,
+                    sections=result.sections,
+                    elements=result.elements,
+                )
+            )
+        else:
+            documents.append(result)
+
+    return documents
+
+
+def _parse_files(
+    adoc_files: list[Path],
+    md_files: list[Path],
+    asciidoc_parser: AsciidocStructureParser,
+    markdown_parser: MarkdownStructureParser,
+    *,
+    parallel: bool = False,
+) -> list[AsciidocDocument | MarkdownDocument | Exception]:
+    """Parse AsciiDoc root documents and Markdown files.
+
+    The files are independent of each other (includes are expanded per root
+    document), so when parallel parsing is requested, with enough source to
+    parse and more than one CPU, they are parsed in a process pool with at
+    most one worker per file. Results keep
+    the order of ``adoc_files + md_files``.
+
+    Args:
+        adoc_files: Root AsciiDoc documents to parse
+        md_files: Markdown files to parse
+        asciidoc_parser: Parser for AsciiDoc files; workers use its settings
+        markdown_parser: Parser for Markdown files; workers use its settings
+        parallel: If True, a process pool may be used
+
+    Returns:
+        For each file, the parsed document or the exception raised for it
+    """
+    files = adoc_files + md_files
+    workers = min(os.cpu_count() or 1, len(files))
+    if parallel and workers > 1 and _total_size(files) >= PARALLEL_PARSE_MIN_BYTES:
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            ) as pool:
+                futures = [
+                    pool.submit(
+                        parse_asciidoc_file,
+                        file_path,
+                        asciidoc_parser.base_path,
+                        asciidoc_parser.max_include_depth,
+                    )
+                    for file_path in adoc_files
+                ]
+                futures += [
+                    pool.submit(parse_markdown_file, file_path, markdown_parser.base_path)
+                    for file_path in md_files
+                ]
+                results: list[AsciidocDocument | MarkdownDocument | Exception] = []
+                for future in futures:
+                    try:
+                        results.append(future.result())
+                    except BrokenProcessPool:
+                        raise
+                    except Exception as e:
+                        results.append(e)
+                return results
+        except (BrokenProcessPool, OSError) as e:
+            logger.info("Parallel parsing unavailable, parsing serially: %s", e)
+
+    parsers = [asciidoc_parser] * len(adoc_files) + [markdown_parser] * len(md_files)
+    results = []
+    for parser, file_path in zip(parsers, files):
+        try:
+            results.append(parser.parse_file(file_path))
+        except Exception as e:
+            results.append(e)
+    return results
+
+
+def _total_size(files: list[Path]) -> int:
+    """Sum the sizes of files, counting unreadable ones as empty.
+
+    Included files are not counted, so this underestimates the work for
+    documents with includes; that only keeps small sets on the serial path.
+    """
+    total = 0
+    for file_path in files:
+        try:
+            total += file_path.stat().st_size
+        except OSError:
+            pass
+    return total
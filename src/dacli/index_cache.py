@@ -0,0 +1,196 @@
+"""On-disk cache of parsed documents for the CLI.
+
+Every CLI invocation builds the structure index from scratch, and parsing all
+documents dominates the run time of short commands. This module pickles the
+parsed documents together with the modification time and size of every file
+they were built from (the documents themselves and all resolved includes).
+A cached result is used as a whole when the same files are found and none of
+them has changed. Otherwise, documents whose own file and includes are all
+unchanged can still be reused, so only the changed documents are parsed again.
+
+Files modified within the last few seconds prevent the cache from being
+written: a second change within the same timestamp tick could leave both
+modification time and size untouched.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import time
+from pathlib import Path
+
+from dacli import __version__
+from dacli.models import Document
+
+logger = logging.getLogger(__name__)
+
+# Bump when the pickled layout changes; the package version covers parser changes
+CACHE_FORMAT = 2
+
+_RACY_WINDOW_NS = 2_000_000_000
+
+Fingerprint = dict[Path, tuple[int, int] | None]
+
+
+def default_cache_dir() -> Path:
+    """Get the per-user cache directory.
+
+    ``$DACLI_CACHE_DIR`` takes precedence over ``$XDG_CACHE_HOME/dacli``.
+
+    Returns:
+        Directory for dacli cache files
+    """
+    cache_dir = os.environ.get("DACLI_CACHE_DIR")
+    if cache_dir:
+        return Path(cache_dir)
+    cache_home = os.environ.get("XDG_CACHE_HOME")
+    base = Path(cache_home) if cache_home else Path.home() / ".cache"
+    return base / "dacli"
+
+
+def get_cache_path(
+    cache_dir: Path,
+    docs_root: Path,
+    *,
+    respect_gitignore: bool,
+    include_hidden: bool,
+) -> Path:
+    """Get the cache file for a docs root and file discovery options.
+
+    Args:
+        cache_dir: Directory holding cache files
+        docs_root: Documentation root directory
+        respect_gitignore: Whether .gitignore patterns are applied
+        include_hidden: Whether hidden directories are included
+
+    Returns:
+        Path of the cache file (which may not exist yet)
+    """
+    key = f"{docs_root.resolve()}|{respect_gitignore}|{include_hidden}"
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+    return cache_dir / f"index-{digest}.pickle"
+
+
+def load_documents(cache_path: Path, doc_files: list[Path]) -> list[Document] | None:
+    """Load cached documents if they are still valid.
+
+    Args:
+        cache_path: Cache file to read
+        doc_files: Document files found in the docs root, in discovery order
+
+    Returns:
+        The cached documents, or None if there is no usable cache entry
+    """
+    data = _read_cache(cache_path)
+    if data is None or data["doc_files"] != doc_files:
+        return None
+
+    fingerprint: Fingerprint = data["fingerprint"]
+    for path, expected in fingerprint.items():
+        if _stat_key(path) != expected:
+            return None
+
+    logger.info("Loaded %d documents from index cache %s", len(data["documents"]), cache_path)
+    return data["documents"]
+
+
+def load_unchanged_documents(cache_path: Path) -> dict[Path, Document]:
+    """Load the cached documents whose source files have not changed.
+
+    Used when the cache as a whole is stale: a document is still valid if
+    neither its own file nor any file it includes has changed since it was
+    cached.
+
+    Args:
+        cache_path: Cache file to read
+
+    Returns:
+        Unchanged documents by file path (empty if there is no usable cache)
+    """
+    data = _read_cache(cache_path)
+    if data is None:
+        return {}
+
+    fingerprint: Fingerprint = data["fingerprint"]
+    unchanged = {path for path, key in fingerprint.items() if _stat_key(path) == key}
+
+    documents = {}
+    for doc in data["documents"]:
+        if doc.file_path in unchanged and all(
+            include.target_path in unchanged for include in getattr(doc, "includes", ())
+        ):
+            documents[doc.file_path] = doc
+
+    logger.info("Reusing %d unchanged documents from index cache %s", len(documents), cache_path)
+    return documents
+
+
+def save_documents(
+    cache_path: Path, doc_files: list[Path], documents: list[Document]
+) -> None:
+    """Write parsed documents to the cache.
+
+    Nothing is written if one of the source files was modified too recently
+    to be fingerprinted reliably. Failures are logged and otherwise ignored.
+
+    Args:
+        cache_path: Cache file to write
+        doc_files: Document files found in the docs root, in discovery order
+        documents: Documents parsed from those files
+    """
+    fingerprint = _fingerprint(doc_files, documents)
+    racy_after = time.time_ns() - _RACY_WINDOW_NS
+    if any(key is not None and key[0] > racy_after for key in fingerprint.values()):
+        logger.debug("Not caching index: source files were modified just now")
+        return
+
+    data = {
+        "version": (CACHE_FORMAT, __version__),
+        "doc_files": doc_files,
+        "fingerprint": fingerprint,
+        "documents": documents,
+    }
+    temp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with temp_path.open("wb") as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, cache_path)
+    except Exception as e:
+        logger.debug("Could not write index cache %s: %s", cache_path, e)
+        temp_path.unlink(missing_ok=True)
+
+
+def _read_cache(cache_path: Path) -> dict | None:
+    """Read a cache file written by this version, or None if there is none."""
+    try:
+        with cache_path.open("rb") as f:
+            data = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:  # corrupt or incompatible cache file
+        logger.debug("Ignoring unreadable index cache %s: %s", cache_path, e)
+        return None
+
+    if not isinstance(data, dict) or data.get("version") != (CACHE_FORMAT, __version__):
+        return None
+    return data
+
+
+def _fingerprint(doc_files: list[Path], documents: list[Document]) -> Fingerprint:
+    """Collect modification time and size of every file the documents depend on."""
+    paths = set(doc_files)
+    for doc in documents:
+        for include in getattr(doc, "includes", ()):
+            paths.add(include.target_path)
+    return {path: _stat_key(path) for path in paths}
+
+
+def _stat_key(path: Path) -> tuple[int, int] | None:
+    """Get (mtime_ns, size) of a file, or None if it cannot be stat'ed."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
@@ -16,8 +16,6 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 from dacli.models import Element, Section, SourceLocation
 from dacli.parser_utils import (
     collect_all_sections,
@@ -262,6 +260,9 @@ class MarkdownStructureParser:
         if not match:
             return {}, content
 
+        # Imported here: yaml is slow to import and most files have no frontmatter
+        import yaml
+
         yaml_content = match.group(1)
         try:
             frontmatter = yaml.safe_load(yaml_content)
@@ -893,3 +894,23 @@ class MarkdownStructureParser:
 
         # Full path is file_prefix:section_path
         return f"{file_prefix}:{section_path}"
+
+
+def parse_markdown_file(file_path: Path, base_path: Path | None = None) -> MarkdownDocument:
+    """Parse a single Markdown file with a fresh parser.
+
+    Module-level counterpart of ``parse_asciidoc_file`` so Markdown files can
+    be handed to the same process pool as AsciiDoc documents.
+
+    Args:
+        file_path: Path to the Markdown file
+        base_path: Optional base path for calculating file prefixes
+
+    Returns:
+        Parsed MarkdownDocument
+
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        UnicodeDecodeError: If file has invalid encoding
+    """
+    return MarkdownStructureParser(base_path).parse_file(file_path)
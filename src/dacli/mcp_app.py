@@ -22,9 +22,9 @@ from fastmcp import FastMCP
 from dacli import __version__
 from dacli.asciidoc_parser import AsciidocStructureParser
 from dacli.file_handler import FileReadError, FileSystemHandler, FileWriteError
-from dacli.file_utils import find_doc_files
+from dacli.index_builder import _build_index
 from dacli.markdown_parser import MarkdownStructureParser
-from dacli.models import Document
+from dacli.models import element_to_dict
 from dacli.services import (
     compute_hash,
     get_project_metadata,
@@ -36,7 +36,6 @@ from dacli.services import (
 from dacli.services import (
     validate_structure as service_validate_structure,
 )
-from dacli.services.content_service import _get_section_end_line
 from dacli.structure_index import StructureIndex
 
 # Configure logging to stderr (stdout is reserved for MCP protocol)
@@ -163,15 +162,14 @@ def create_mcp_server(
 
         # Read actual content from file
         try:
-            file_content = file_handler.read_file(section.source_location.file)
-            lines = file_content.splitlines()
-
-            start_line = section.source_location.line - 1  # Convert to 0-based
+            file_path = section.source_location.file
             end_line = section.source_location.end_line
             if end_line is None:
-                end_line = len(lines)
+                end_line = file_handler.count_lines(file_path)
 
-            content = "\n".join(lines[start_line:end_line])
+            content = file_handler.read_section(
+                file_path, section.source_location.line, end_line
+            )
 
             # Determine format
             file_ext = section.source_location.file.suffix.lower()
@@ -303,32 +301,10 @@ def create_mcp_server(
         )
 
         # Build element dicts with optional content (Issue #159)
-        element_dicts = []
-        for e in elements:
-            elem_dict = {
-                "type": e.type,
-                "parent_section": e.parent_section,
-                "location": {
-                    "file": str(e.source_location.file),
-                    "start_line": e.source_location.line,
-                    "end_line": e.source_location.end_line,
-                },
-            }
-
-            # Include attributes if requested (Issue #159)
-            if include_content:
-                attributes = dict(e.attributes)  # Copy attributes
-
-                # Apply content limit if specified
-                if content_limit is not None and "content" in attributes:
-                    content = attributes["content"]
-                    lines = content.split("\n")
-                    if len(lines) > content_limit:
-                        attributes["content"] = "\n".join(lines[:content_limit])
-
-                elem_dict["attributes"] = attributes
-
-            element_dicts.append(elem_dict)
+        file_names: dict[Path, str] = {}  # one shared string per source file
+        element_dicts = [
+            element_to_dict(e, include_content, content_limit, file_names) for e in elements
+        ]
 
         return {
             "elements": element_dicts,
@@ -414,7 +390,6 @@ def create_mcp_server(
 
         file_path = section.source_location.file
         start_line = section.source_location.line
-        end_line = _get_section_end_line(section, file_path, file_handler)
 
         # Prepare content
         insert_content = content
@@ -428,6 +403,11 @@ def create_mcp_server(
 
             lines = file_content.splitlines(keepends=True)
 
+            # A section without a known end line runs to the end of the file
+            end_line = section.source_location.end_line
+            if end_line is None:
+                end_line = len(lines)
+
             if position == "before":
                 insert_line = start_line
                 new_lines = lines[: start_line - 1] + [insert_content] + lines[start_line - 1 :]
@@ -500,79 +480,3 @@ def create_mcp_server(
 
     return mcp
 
-
-def _build_index(
-    docs_root: Path,
-    index: StructureIndex,
-    asciidoc_parser: AsciidocStructureParser,
-    markdown_parser: MarkdownStructureParser,
-    *,
-    respect_gitignore: bool = True,
-    include_hidden: bool = False,
-) -> None:
-    """Build the structure index from documents in docs_root.
-
-    Args:
-        docs_root: Root directory containing documentation
-        index: StructureIndex to populate
-        asciidoc_parser: Parser for AsciiDoc files
-        markdown_parser: Parser for Markdown files
-        respect_gitignore: If True, exclude files matching .gitignore patterns
-        include_hidden: If True, include files in hidden directories
-    """
-    documents: list[Document] = []
-
-    # Find all AsciiDoc files first (Issue #184)
-    all_adoc_files = list(
-        find_doc_files(
-            docs_root, "*.adoc", respect_gitignore=respect_gitignore, include_hidden=include_hidden
-        )
-    )
-
-    # Scan for include directives to identify included files (Issue #184)
-    # Included files should not be parsed as separate root documents
-    included_files: set[Path] = set()
-    for adoc_file in all_adoc_files:
-        included_files.update(AsciidocStructureParser.scan_includes(adoc_file))
-
-    # Filter: only parse files that are NOT included by others (Issue #184)
-    root_adoc_files = [f for f in all_adoc_files if f not in included_files]
-
-    logger.info(
-        f"Found {len(all_adoc_files)} AsciiDoc files, "
-        f"{len(included_files)} included, "
-        f"{len(root_adoc_files)} root documents"
-    )
-
-    # Parse root AsciiDoc files only
-    for adoc_file in root_adoc_files:
-        try:
-            doc = asciidoc_parser.parse_file(adoc_file)
-            documents.append(doc)
-        except Exception as e:
-            # Log but continue with other files
-            logger.warning("Failed to parse %s: %s", adoc_file, e)
-
-    # Find and parse Markdown files
-    for md_file in find_doc_files(
-        docs_root, "*.md", respect_gitignore=respect_gitignore, include_hidden=include_hidden
-    ):
-        try:
-            md_doc = markdown_parser.parse_file(md_file)
-            # Convert MarkdownDocument to Document
-            doc = Document(
-                file_path=md_doc.file_path,
-                title=md_doc.title,
-                sections=md_doc.sections,
-                elements=md_doc.elements,
-            )
-            documents.append(doc)
-        except Exception as e:
-            logger.warning("Failed to parse %s: %s", md_file, e)
-
-    # Build index
-    warnings = index.build_from_documents(documents)
-    for warning in warnings:
-        logger.warning("Index: %s", warning)
-
-
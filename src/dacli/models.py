@@ -2,7 +2,10 @@
 
 This module defines the shared data models used across all parsers and services.
 All models are implemented as dataclasses for simplicity and spec conformity.
-JSON serialization is provided via the model_to_dict() helper function.
+The high-volume models (SourceLocation, Section, Element) use slots to keep
+the per-instance footprint small on large documents.
+JSON serialization is provided via the model_to_dict() helper function;
+element_to_dict() builds the element output shared by the CLI and MCP tools.
 
 Models:
 - SourceLocation: Position in source document with include tracking
@@ -25,7 +28,7 @@ class WarningType(Enum):
     UNCLOSED_TABLE = "unclosed_table"
 
 
-@dataclass
+@dataclass(slots=True)
 class SourceLocation:
     """Position in a source document.
 
@@ -46,7 +49,7 @@ class SourceLocation:
     resolved_from: Path | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Section:
     """A hierarchical section in a document.
 
@@ -70,7 +73,7 @@ class Section:
     anchor: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Element:
     """An extractable content element.
 
@@ -173,6 +176,58 @@ def model_to_dict(obj: Any) -> Any:
     return obj
 
 
+def element_to_dict(
+    e: Element,
+    include_content: bool,
+    content_limit: int | None,
+    file_names: dict[Path, str],
+) -> dict:
+    """Convert an element to the output dict of the CLI and MCP get_elements.
+
+    ``file_names`` memoizes ``str()`` of source files, so elements of the
+    same file share one string instead of each holding its own copy.
+
+    Args:
+        e: The element to convert
+        include_content: If True, include the element attributes (Issue #159)
+        content_limit: Keep only the first N lines of the content
+        file_names: Cache of file name strings, shared across one result
+
+    Returns:
+        Dict with type, parent_section, location and optionally attributes
+    """
+    file_path = e.source_location.file
+    file_name = file_names.get(file_path)
+    if file_name is None:
+        file_name = file_names[file_path] = str(file_path)
+
+    elem_dict = {
+        "type": e.type,
+        "parent_section": e.parent_section,
+        "location": {
+            "file": file_name,
+            "start_line": e.source_location.line,
+            "end_line": e.source_location.end_line,
+        },
+    }
+
+    if include_content:
+        # Output is only serialized, so attributes are copied only when
+        # the content has to be truncated
+        attributes = e.attributes
+
+        if content_limit is not None and "content" in attributes:
+            # maxsplit stops splitting right after the last line that is kept
+            lines = attributes["content"].split("\n", content_limit)
+            if len(lines) > content_limit:
+                attributes = dict(attributes)
+                attributes["content"] = "\n".join(lines[:content_limit])
+
+        elem_dict["attributes"] = attributes
+
+    return elem_dict
+
+
 def _convert_value(value: Any) -> Any:
     """Convert a value to JSON-serializable format.
 
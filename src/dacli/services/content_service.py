@@ -3,7 +3,7 @@
 Provides shared logic for CLI and MCP content manipulation operations.
 """
 
-import hashlib
+import zlib
 from pathlib import Path
 
 from dacli.file_handler import FileReadError, FileSystemHandler, FileWriteError
@@ -11,15 +11,18 @@ from dacli.structure_index import StructureIndex
 
 
 def compute_hash(content: str) -> str:
-    """Compute MD5 hash (first 8 chars) for optimistic locking.
+    """Compute a CRC-32 checksum (8 hex chars) for optimistic locking.
+
+    The hash only detects concurrent modifications, so a fast checksum is
+    used instead of a cryptographic digest.
 
     Args:
         content: The content to hash.
 
     Returns:
-        First 8 characters of MD5 hex digest.
+        CRC-32 of the UTF-8 encoded content as 8 lowercase hex characters.
     """
-    return hashlib.md5(content.encode("utf-8")).hexdigest()[:8]
+    return f"{zlib.crc32(content.encode('utf-8')):08x}"
 
 
 def _get_section_end_line(
@@ -42,11 +45,9 @@ def _get_section_end_line(
     if section.source_location.end_line is not None:
         return section.source_location.end_line
 
-    # Fallback: read file and calculate
+    # Fallback: the section runs to the end of the file
     try:
-        content = file_handler.read_file(file_path)
-        total_lines = len(content.splitlines())
-        return total_lines
+        return file_handler.count_lines(file_path)
     except FileReadError:
         return section.source_location.line
 
@@ -93,12 +94,14 @@ def update_section(
     end_line = _get_section_end_line(section, file_path, file_handler)
 
     # Read current content and compute hash for optimistic locking
+    file_content: str | None
     try:
         file_content = file_handler.read_file(file_path)
         lines = file_content.splitlines(keepends=True)
         current_content = "".join(lines[start_line - 1 : end_line])
         previous_hash = compute_hash(current_content)
     except FileReadError:
+        file_content = None
         previous_hash = ""
 
     # Check for conflict if expected_hash is provided
@@ -116,9 +119,7 @@ def update_section(
     new_content = content
     if preserve_title:
         stripped_content = new_content.lstrip()
-        has_explicit_title = (
-            stripped_content.startswith("=") or stripped_content.startswith("#")
-        )
+        has_explicit_title = stripped_content.startswith(("=", "#"))
 
         # If content has a heading, strip it (we always use the original title)
         if has_explicit_title:
@@ -142,9 +143,7 @@ def update_section(
         # Issue #195: When preserve_title is False, content must include a title
         # to maintain document structure
         stripped_content = new_content.lstrip()
-        has_title = (
-            stripped_content.startswith("=") or stripped_content.startswith("#")
-        )
+        has_title = stripped_content.startswith(("=", "#"))
         if not has_title:
             return {
                 "success": False,
@@ -165,14 +164,23 @@ def update_section(
     # Compute new hash
     new_hash = compute_hash(new_content)
 
-    # Perform update
+    # Perform update, splicing into the content read for the hash above
     try:
-        file_handler.update_section(
-            path=file_path,
-            start_line=start_line,
-            end_line=end_line,
-            new_content=new_content,
-        )
+        if file_content is None:
+            file_handler.update_section(
+                path=file_path,
+                start_line=start_line,
+                end_line=end_line,
+                new_content=new_content,
+            )
+        else:
+            file_handler.update_section_with_content(
+                path=file_path,
+                content=file_content,
+                start_line=start_line,
+                end_line=end_line,
+                new_content=new_content,
+            )
         return {
             "success": True,
             "path": normalized_path,
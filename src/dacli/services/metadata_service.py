@@ -4,10 +4,26 @@ Provides shared logic for CLI and MCP metadata operations.
 """
 
 from datetime import UTC, datetime
+from pathlib import Path
 
 from dacli.structure_index import StructureIndex
 
 
+def _get_mtime(file_path: Path) -> float | None:
+    """Get a file's modification time with a single stat call.
+
+    Args:
+        file_path: Path to the file.
+
+    Returns:
+        Modification time as POSIX timestamp, or None if the file is missing.
+    """
+    try:
+        return file_path.stat().st_mtime
+    except OSError:
+        return None
+
+
 def get_project_metadata(index: StructureIndex) -> dict:
     """Get project-level metadata.
 
@@ -27,17 +43,11 @@ def get_project_metadata(index: StructureIndex) -> dict:
     files = set(index._file_to_sections.keys())
 
     # Calculate total words from all section content
-    total_words = 0
-    for content in index._section_content.values():
-        total_words += len(content.split())
+    total_words = index.get_total_word_count()
 
     # Find latest modification time
-    last_modified = None
-    for file_path in files:
-        if file_path.exists():
-            mtime = file_path.stat().st_mtime
-            if last_modified is None or mtime > last_modified:
-                last_modified = mtime
+    mtimes = [mtime for mtime in map(_get_mtime, files) if mtime is not None]
+    last_modified = max(mtimes, default=None)
 
     # Detect formats from file extensions
     formats = set()
@@ -88,14 +98,13 @@ def get_section_metadata(index: StructureIndex, path: str) -> dict:
         return {"error": f"Section '{normalized_path}' not found"}
 
     # Get word count from section content
-    content = index._section_content.get(normalized_path, "")
-    word_count = len(content.split())
+    word_count = index.get_word_count(normalized_path)
 
     # Get file modification time
     file_path = section.source_location.file
     last_modified = None
-    if file_path.exists():
-        mtime = file_path.stat().st_mtime
+    mtime = _get_mtime(file_path)
+    if mtime is not None:
         last_modified = datetime.fromtimestamp(mtime, tz=UTC).isoformat()
 
     # Count subsections
@@ -6,7 +6,6 @@ Provides shared logic for CLI and MCP validation operations.
 import time
 from pathlib import Path
 
-from dacli.file_utils import find_doc_files
 from dacli.structure_index import StructureIndex
 
 
@@ -36,15 +35,23 @@ def validate_structure(index: StructureIndex, docs_root: Path) -> dict:
     # Get all indexed files
     indexed_files = set(index._file_to_sections.keys())
 
+    # Indexed files are usually discovered again below; resolve each path once
+    resolved_paths: dict[Path, Path] = {}
+
+    def resolve(path: Path) -> Path:
+        resolved = resolved_paths.get(path)
+        if resolved is None:
+            resolved = resolved_paths[path] = path.resolve()
+        return resolved
+
+    # Imported here: pathspec is only needed when validating, not at CLI startup
+    from dacli.file_utils import find_doc_files
+
     # Get all doc files in docs_root (respecting gitignore)
-    all_doc_files: set[Path] = set()
-    for adoc_file in find_doc_files(docs_root, "*.adoc"):
-        all_doc_files.add(adoc_file.resolve())
-    for md_file in find_doc_files(docs_root, "*.md"):
-        all_doc_files.add(md_file.resolve())
+    all_doc_files = {resolve(f) for f in find_doc_files(docs_root, "*.adoc", "*.md")}
 
     # Check for orphaned files (files not indexed)
-    indexed_resolved = {f.resolve() for f in indexed_files}
+    indexed_resolved = {resolve(f) for f in indexed_files}
     docs_root_resolved = docs_root.resolve()
     for doc_file in all_doc_files:
         if doc_file not in indexed_resolved:
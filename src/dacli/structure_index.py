@@ -12,6 +12,7 @@ Key features:
 """
 
 import logging
+from bisect import bisect_left
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -20,7 +21,7 @@ from dacli.models import Document, Element, Section
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchResult:
     """A search result with context.
 
@@ -37,6 +38,13 @@ class SearchResult:
     score: float
 
 
+def _max_end_line(a: int | None, b: int | None) -> int | None:
+    """Return the larger end line, or None if either is unknown."""
+    if a is None or b is None:
+        return None
+    return max(a, b)
+
+
 class StructureIndex:
     """In-memory index for fast document structure lookups and full-text search.
 
@@ -50,8 +58,13 @@ class StructureIndex:
         _elements: List of all elements
         _type_to_elements: Mapping of element type to list of Elements
         _section_to_elements: Mapping of section path to list of Elements
+        _sorted_element_sections: Sorted keys of _section_to_elements (built lazily)
         _file_to_sections: Mapping of file path to list of Sections
         _section_content: Mapping of section path to content for full-text search
+        _subtree_end_lines: Per-file mapping of section path to the last line
+            of the section including its descendants (built lazily)
+        _word_counts: Mapping of section path to the word count of its content
+            (filled lazily)
         _documents: List of indexed documents
         _index_ready: Whether the index has been built
     """
@@ -63,8 +76,11 @@ class StructureIndex:
         self._elements: list[Element] = []
         self._type_to_elements: dict[str, list[Element]] = {}
         self._section_to_elements: dict[str, list[Element]] = {}
+        self._sorted_element_sections: list[str] | None = None
         self._file_to_sections: dict[Path, list[Section]] = {}
         self._section_content: dict[str, str] = {}  # Content for full-text search
+        self._subtree_end_lines: dict[Path, dict[str, int | None]] = {}
+        self._word_counts: dict[str, int] = {}
         self._documents: list[Document] = []
         self._top_level_sections: list[Section] = []
         self._index_ready: bool = False
@@ -85,12 +101,15 @@ class StructureIndex:
 
         self._documents = documents
 
+        # Lines of each source file, read once for the content of all its sections
+        file_lines: dict[Path, list[str] | None] = {}
+
         # Index all sections and elements from each document
         for doc in documents:
             # Index sections recursively
             for section in doc.sections:
                 self._top_level_sections.append(section)
-                section_warnings = self._index_section(section)
+                section_warnings = self._index_section(section, file_lines)
                 warnings.extend(section_warnings)
 
             # Index elements
@@ -163,6 +182,85 @@ class StructureIndex:
         """
         return self._file_to_sections.get(file_path, [])
 
+    def get_subtree_end_line(self, section: Section) -> int | None:
+        """Get the last line of a section including all of its descendants.
+
+        Descendants are the sections in the same file whose path continues the
+        section's path after a ":" or "." separator (Issue #197). The values
+        for a file are computed on first use in a single pass over its sections.
+
+        Args:
+            section: An indexed section
+
+        Returns:
+            Highest end_line of the section and its descendants, or None if
+            the section is not indexed or one of those end lines is unknown
+        """
+        file_path = section.source_location.file
+        end_lines = self._subtree_end_lines.get(file_path)
+        if end_lines is None:
+            end_lines = self._compute_subtree_end_lines(file_path)
+            self._subtree_end_lines[file_path] = end_lines
+        return end_lines.get(section.path)
+
+    def get_word_count(self, path: str) -> int:
+        """Get the number of whitespace-separated words in a section's content.
+
+        Counts are computed on first use and kept until the index is rebuilt.
+
+        Args:
+            path: Hierarchical section path
+
+        Returns:
+            Word count, 0 if the section has no stored content
+        """
+        count = self._word_counts.get(path)
+        if count is None:
+            count = len(self._section_content.get(path, "").split())
+            self._word_counts[path] = count
+        return count
+
+    def get_total_word_count(self) -> int:
+        """Get the total word count over the content of all sections.
+
+        Returns:
+            Sum of the word counts of all sections with stored content
+        """
+        get_word_count = self.get_word_count
+        return sum(get_word_count(path) for path in self._section_content)
+
+    def _compute_subtree_end_lines(self, file_path: Path) -> dict[str, int | None]:
+        """Compute subtree end lines for every section of a file.
+
+        Each section's end_line is propagated to every ancestor path in the file,
+        i.e. every prefix of its path that ends right before a ":" or ".".
+
+        Args:
+            file_path: Path to the source file
+
+        Returns:
+            Mapping of section path to subtree end line (None if unknown)
+        """
+        sections = self._file_to_sections.get(file_path, [])
+        end_lines: dict[str, int | None] = {
+            s.path: s.source_location.end_line for s in sections
+        }
+
+        for s in sections:
+            path = s.path
+            end_line = s.source_location.end_line
+            if path and "" in end_lines:
+                # A section with an empty path is the parent of everything
+                end_lines[""] = _max_end_line(end_lines[""], end_line)
+            pos = max(path.rfind(":"), path.rfind("."))
+            while pos > 0:
+                ancestor = path[:pos]
+                if ancestor in end_lines:
+                    end_lines[ancestor] = _max_end_line(end_lines[ancestor], end_line)
+                pos = max(path.rfind(":", 0, pos), path.rfind(".", 0, pos))
+
+        return end_lines
+
     def get_suggestions(
         self, requested_path: str, max_suggestions: int = 5
     ) -> list[str]:
@@ -352,6 +450,24 @@ class StructureIndex:
         Returns:
             List of matching elements
         """
+        # Sections whose elements are wanted, if filtered by section
+        section_paths = None
+        if section_path is not None:
+            if recursive:
+                # Prefix match: include elements from child sections
+                # Match exact path or path followed by separator (. or :)
+                section_paths = self._get_element_section_subtree(section_path)
+            else:
+                # Exact match only
+                section_paths = {section_path}
+
+        if section_paths is not None and len(section_paths) == 1:
+            # A single section's elements are already grouped in document order
+            elements = self._section_to_elements.get(section_path, [])
+            if element_type is not None:
+                return [e for e in elements if e.type == element_type]
+            return list(elements)
+
         # Start with all elements or filtered by type
         if element_type is not None:
             elements = self._type_to_elements.get(element_type, [])
@@ -359,22 +475,37 @@ class StructureIndex:
             elements = self._elements
 
         # Further filter by section if specified
-        if section_path is not None:
-            if recursive:
-                # Prefix match: include elements from child sections
-                # Match exact path or path followed by separator (. or :)
-                elements = [
-                    e for e in elements
-                    if e.parent_section == section_path
-                    or e.parent_section.startswith(section_path + ".")
-                    or e.parent_section.startswith(section_path + ":")
-                ]
-            else:
-                # Exact match only
-                elements = [e for e in elements if e.parent_section == section_path]
+        if section_paths is not None:
+            elements = [e for e in elements if e.parent_section in section_paths]
 
         return elements
 
+    def _get_element_section_subtree(self, section_path: str) -> set[str]:
+        """Get a section path and the paths of its descendants that have elements.
+
+        Descendant paths continue the section path after a "." or ":" separator.
+        Because they share that prefix, each separator's descendants form one
+        contiguous range of the sorted element section paths, which is found by
+        bisection.
+
+        Args:
+            section_path: Hierarchical section path
+
+        Returns:
+            The section path and all descendant paths with elements
+        """
+        paths = self._sorted_element_sections
+        if paths is None:
+            paths = self._sorted_element_sections = sorted(self._section_to_elements)
+
+        subtree = {section_path}
+        for separator in ".:":
+            prefix = section_path + separator
+            # Every string starting with prefix sorts before this bound
+            bound = section_path + chr(ord(separator) + 1)
+            subtree.update(paths[bisect_left(paths, prefix) : bisect_left(paths, bound)])
+        return subtree
+
     def search(
         self,
         query: str,
@@ -487,8 +618,11 @@ class StructureIndex:
         self._elements.clear()
         self._type_to_elements.clear()
         self._section_to_elements.clear()
+        self._sorted_element_sections = None
         self._file_to_sections.clear()
         self._section_content.clear()
+        self._subtree_end_lines.clear()
+        self._word_counts.clear()
         self._documents.clear()
         self._top_level_sections.clear()
         self._index_ready = False
@@ -515,11 +649,14 @@ class StructureIndex:
             },
         }
 
-    def _index_section(self, section: Section) -> list[str]:
+    def _index_section(
+        self, section: Section, file_lines: dict[Path, list[str] | None]
+    ) -> list[str]:
         """Index a section and its children recursively.
 
         Args:
             section: Section to index
+            file_lines: Lines of the source files read so far in this build
 
         Returns:
             List of warning messages
@@ -537,7 +674,7 @@ class StructureIndex:
             # Reject the duplicate - do not add to any index
             # Still index children recursively in case they have unique paths
             for child in section.children:
-                child_warnings = self._index_section(child)
+                child_warnings = self._index_section(child, file_lines)
                 warnings.extend(child_warnings)
             return warnings
 
@@ -556,38 +693,57 @@ class StructureIndex:
         self._file_to_sections[file_path].append(section)
 
         # Read and store section content for full-text search
-        self._store_section_content(section)
+        self._store_section_content(section, file_lines)
 
         # Index children recursively
         for child in section.children:
-            child_warnings = self._index_section(child)
+            child_warnings = self._index_section(child, file_lines)
             warnings.extend(child_warnings)
 
         return warnings
 
-    def _store_section_content(self, section: Section) -> None:
+    def _store_section_content(
+        self, section: Section, file_lines: dict[Path, list[str] | None]
+    ) -> None:
         """Read and store section content for full-text search.
 
         Args:
             section: Section to read content for
+            file_lines: Lines of the source files read so far in this build;
+                the section's file is read and added if it is missing
         """
-        try:
-            file_path = section.source_location.file
-            if not file_path.exists():
-                return
+        file_path = section.source_location.file
+        if file_path not in file_lines:
+            file_lines[file_path] = self._read_lines(file_path, section.path)
+        lines = file_lines[file_path]
+        if lines is None:
+            return
 
-            content = file_path.read_text(encoding="utf-8")
-            lines = content.splitlines()
+        start_line = section.source_location.line - 1  # Convert to 0-based
+        end_line = section.source_location.end_line
+        if end_line is None:
+            end_line = len(lines)
 
-            start_line = section.source_location.line - 1  # Convert to 0-based
-            end_line = section.source_location.end_line
-            if end_line is None:
-                end_line = len(lines)
+        self._section_content[section.path] = "\n".join(lines[start_line:end_line])
 
-            section_content = "\n".join(lines[start_line:end_line])
-            self._section_content[section.path] = section_content
+    @staticmethod
+    def _read_lines(file_path: Path, section_path: str) -> list[str] | None:
+        """Read the lines of a section's source file.
+
+        Args:
+            file_path: File to read
+            section_path: Path of the section the file is read for (for logging)
+
+        Returns:
+            Lines of the file, or None if it does not exist or cannot be read
+        """
+        try:
+            if not file_path.exists():
+                return None
+            return file_path.read_text(encoding="utf-8").splitlines()
         except (OSError, UnicodeDecodeError) as e:
-            logger.warning("Failed to read content for section '%s': %s", section.path, e)
+            logger.warning("Failed to read content for section '%s': %s", section_path, e)
+            return None
 
     def _index_element(self, element: Element) -> None:
         """Index an element.
@@ -479,6 +479,29 @@ class TestElementExtraction:
         admonition_elements = [e for e in doc.elements if e.type == "admonition"]
         assert len(admonition_elements) == 2  # NOTE and WARNING
 
+    def test_admonition_requires_exact_label(self, tmp_path):
+        """Test that only exact admonition labels followed by a colon match."""
+        from dacli.asciidoc_parser import AsciidocStructureParser
+
+        doc_file = tmp_path / "admonitions.adoc"
+        doc_file.write_text(
+            "= Doc\n\n"
+            "TIP:no space\n\n"
+            "CAUTION:   \n\n"
+            "NOTES: not an admonition\n\n"
+            "Note: lowercase is not an admonition\n\n"
+            "IMPORTANT : space before colon\n"
+        )
+
+        parser = AsciidocStructureParser(base_path=tmp_path)
+        doc = parser.parse_file(doc_file)
+
+        admonitions = [e.attributes for e in doc.elements if e.type == "admonition"]
+        assert admonitions == [
+            {"admonition_type": "TIP", "content": "no space"},
+            {"admonition_type": "CAUTION", "content": ""},
+        ]
+
     def test_plantuml_block_is_extracted(self):
         """Test that PlantUML blocks are extracted as elements (AC-ADOC-06)."""
         from dacli.asciidoc_parser import AsciidocStructureParser
@@ -574,6 +597,32 @@ Alice -> Bob: Test
         description = [e for e in list_elements if e.attributes.get("list_type") == "description"]
         assert len(description) >= 1
 
+    def test_line_comments_are_not_elements(self, tmp_path):
+        """Test that // comments are skipped but still separate lists."""
+        from dacli.asciidoc_parser import AsciidocStructureParser
+
+        doc_file = tmp_path / "comments.adoc"
+        doc_file.write_text(
+            "= Doc\n\n"
+            "// term:: looks like a description list\n\n"
+            "* first list\n"
+            "//\n"
+            "* second list\n\n"
+            "[source,python]\n"
+            "----\n"
+            "// kept as code\n\n"
+            "----\n"
+        )
+
+        parser = AsciidocStructureParser(base_path=tmp_path)
+        doc = parser.parse_file(doc_file)
+
+        lists = [e for e in doc.elements if e.type == "list"]
+        assert [e.attributes["list_type"] for e in lists] == ["unordered", "unordered"]
+        assert [e.attributes["content"] for e in lists] == ["* first list", "* second list"]
+        code = next(e for e in doc.elements if e.type == "code")
+        assert code.attributes["content"] == "// kept as code\n"
+
     def test_list_has_parent_section(self):
         """Test that list element has correct parent section."""
         from dacli.asciidoc_parser import AsciidocStructureParser
@@ -1006,6 +1055,42 @@ class TestCircularIncludeDetection:
             # Error message should contain file path
             assert "circular" in str(e).lower()
 
+    def test_circular_include_error_survives_pickling(self):
+        """Test that CircularIncludeError can cross a process boundary."""
+        import pickle
+
+        from dacli.asciidoc_parser import CircularIncludeError
+
+        error = CircularIncludeError(Path("b.adoc"), [Path("a.adoc")])
+        restored = pickle.loads(pickle.dumps(error))
+
+        assert restored.file_path == Path("b.adoc")
+        assert restored.include_chain == [Path("a.adoc")]
+        assert str(restored) == str(error)
+
+
+class TestParseAsciidocFile:
+    """Tests for the module-level parse_asciidoc_file helper."""
+
+    def test_matches_parser_instance(self):
+        """Test that the helper returns the same result as the parser."""
+        from dacli.asciidoc_parser import AsciidocStructureParser, parse_asciidoc_file
+
+        file_path = FIXTURES_DIR / "with_include.adoc"
+        expected = AsciidocStructureParser(base_path=FIXTURES_DIR).parse_file(file_path)
+
+        assert parse_asciidoc_file(file_path, FIXTURES_DIR) == expected
+
+    def test_result_is_picklable(self):
+        """Test that a parsed document round-trips through pickle."""
+        import pickle
+
+        from dacli.asciidoc_parser import parse_asciidoc_file
+
+        doc = parse_asciidoc_file(FIXTURES_DIR / "with_include.adoc", FIXTURES_DIR)
+
+        assert pickle.loads(pickle.dumps(doc)) == doc
+
 
 class TestEdgeCases:
     """Tests for edge cases."""
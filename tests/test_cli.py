@@ -5,6 +5,8 @@ Uses click.testing.CliRunner for testing click commands.
 """
 
 import json
+import subprocess
+import sys
 
 import pytest
 from click.testing import CliRunner
@@ -41,6 +43,33 @@ class TestCliBasic:
         assert result.exit_code == 0
         assert "version" in result.output.lower() or "." in result.output
 
+    def test_subcommand_help_does_not_build_index(self, tmp_path, monkeypatch):
+        """The index is only built when a command uses it."""
+        import dacli.index_builder
+        from dacli.cli import cli
+
+        def fail_build(*args, **kwargs):
+            raise AssertionError("index must not be built")
+
+        monkeypatch.setattr(dacli.index_builder, "_build_index", fail_build)
+        runner = CliRunner()
+
+        for args in (["section", "--help"], ["section"], ["sections-at-level", "x"]):
+            result = runner.invoke(cli, ["--docs-root", str(tmp_path), *args])
+            assert not isinstance(result.exception, AssertionError), args
+
+    def test_cli_import_skips_mcp_server_and_parsers(self):
+        """Importing the CLI loads neither the MCP server framework nor the parsers."""
+        code = (
+            "import sys, dacli.cli; "
+            "print([m for m in ('fastmcp', 'dacli.asciidoc_parser', 'pathspec') "
+            "if m in sys.modules])"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "[]"
+
 
 class TestCliCommandAliases:
     """Test command aliases for shorter typing."""
@@ -235,6 +264,21 @@ Introduction content here.
         data = json.loads(result.output)
         assert isinstance(data, dict)
 
+    def test_section_text_output_is_verbatim(self, tmp_path):
+        """Text output keeps section content as is, even escape characters."""
+        from dacli.cli import cli
+
+        (tmp_path / "test.adoc").write_text(
+            "= Test\n\n== Colors\n\nPrompt: \x1b[1mbold\x1b[0m\n", encoding="utf-8"
+        )
+
+        runner = CliRunner()
+        result = runner.invoke(cli, ["--docs-root", str(tmp_path), "section", "test:colors"])
+
+        assert result.exit_code == 0
+        assert "content: == Colors\n\nPrompt: \x1b[1mbold\x1b[0m\n" in result.output
+        assert result.output.endswith("format: asciidoc\n")
+
     def test_section_not_found_returns_error(self, sample_docs):
         """section command should return error for non-existent path."""
         from dacli.cli import cli
@@ -619,6 +663,57 @@ Content.
         assert "\n" in result.output
         json.loads(result.output)  # Still valid JSON
 
+    def test_yaml_format_matches_json(self, sample_docs):
+        """YAML output carries the same data as JSON output."""
+        import yaml
+
+        from dacli.cli import cli
+
+        runner = CliRunner()
+        base_args = ["--docs-root", str(sample_docs)]
+        yaml_result = runner.invoke(cli, [*base_args, "--format", "yaml", "structure"])
+        json_result = runner.invoke(cli, [*base_args, "--format", "json", "structure"])
+
+        assert yaml_result.exit_code == 0
+        assert yaml.safe_load(yaml_result.output) == json.loads(json_result.output)
+
+    def test_yaml_format_writes_unknown_types_as_strings(self, sample_docs):
+        """Values without a YAML representation are written like JSON's default=str."""
+        from pathlib import Path
+
+        from dacli.cli import CliContext, format_output
+
+        ctx = CliContext(sample_docs, "yaml", pretty=False)
+
+        assert format_output(ctx, {"file": Path("docs/a.adoc")}) == "file: docs/a.adoc\n"
+
+    def test_text_format_nesting(self):
+        """Text output indents nested dicts and lists; empty dicts give an empty line."""
+        from dacli.cli import _format_as_text
+
+        data = {
+            "path": "doc:intro",
+            "location": {"file": "doc.adoc", "lines": [1, 2]},
+            "children": [{"title": "A", "meta": {}}, "plain"],
+            "empty": {},
+        }
+
+        assert _format_as_text(data) == (
+            "path: doc:intro\n"
+            "location:\n"
+            "  file: doc.adoc\n"
+            "  lines:\n"
+            "    - 1\n"
+            "    - 2\n"
+            "children:\n"
+            "  title: A\n"
+            "  meta:\n"
+            "\n"
+            "  - plain\n"
+            "empty:\n"
+        )
+        assert _format_as_text({}) == ""
+
 
 class TestCliVerboseOption:
     """Test the --verbose/-v option for showing warnings."""
@@ -780,6 +875,31 @@ def hello():
             assert "location" in elem
 
 
+class TestElementsJsonOutput:
+    """Compact JSON for elements is written item by item."""
+
+    @pytest.mark.parametrize("body", ["", "[source,python]\n----\nprint(\"ü\")\n----\n"])
+    def test_compact_json_matches_json_dumps(self, tmp_path, body):
+        """Streamed output should be byte-identical to json.dumps output."""
+        from dacli.cli import cli
+
+        (tmp_path / "test.adoc").write_text(f"= Test\n\n== Section\n\n{body}")
+
+        runner = CliRunner()
+        result = runner.invoke(
+            cli,
+            [
+                "--docs-root", str(tmp_path), "--format", "json",
+                "elements", "--include-content",
+            ],
+        )
+
+        assert result.exit_code == 0
+        data = json.loads(result.output)
+        assert data["count"] == len(data["elements"])
+        assert result.output == json.dumps(data) + "\n"
+
+
 class TestCliGitignoreOptions:
     """Test --no-gitignore and --include-hidden options."""
 
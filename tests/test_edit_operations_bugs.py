@@ -67,6 +67,12 @@ class TestEncodingFix193:
         result = _process_escape_sequences(content)
         assert result == "Über\nZeile 2\t\\path"
 
+    def test_process_escape_sequences_keeps_nul_characters(self):
+        """Test that NUL characters in the content are not turned into backslashes."""
+        content = "a\x00b\\\\c\\n"
+        result = _process_escape_sequences(content)
+        assert result == "a\x00b\\c\n"
+
 
 class TestBlankLinesFix194:
     """Tests for Issue #194: Missing blank lines after edit operations."""
@@ -251,6 +251,24 @@ line 5
         assert "line 3" not in result.output
         assert "line 4" not in result.output
 
+    def test_content_limit_keeps_indexed_content(self):
+        """Truncating output content leaves the element's own attributes untouched."""
+        from dacli.models import Element, SourceLocation, element_to_dict
+
+        element = Element(
+            type="code",
+            source_location=SourceLocation(file=Path("doc.adoc"), line=1),
+            attributes={"content": "a\nb\nc"},
+            parent_section="doc",
+        )
+
+        truncated = element_to_dict(element, True, 2, {})
+        untouched = element_to_dict(element, True, 3, {})
+
+        assert truncated["attributes"]["content"] == "a\nb"
+        assert untouched["attributes"]["content"] == "a\nb\nc"
+        assert element.attributes == {"content": "a\nb\nc"}
+
 
 @pytest.fixture
 def cli_runner():
@@ -100,12 +100,179 @@ class TestReadFile:
         content = handler.read_file(file_path)
         assert content == ""
 
+    @pytest.mark.parametrize(
+        "data",
+        [b"crlf\r\nlines\r\n", b"old\rmac\r", b"mixed\r\n\r\n\rend", "\ufeffbom\r\n".encode()],
+    )
+    def test_read_file_matches_read_text(
+        self, handler: FileSystemHandler, tmp_path: Path, data: bytes
+    ):
+        """Newlines are translated exactly as Path.read_text() does."""
+        file_path = tmp_path / "newlines.adoc"
+        file_path.write_bytes(data)
+
+        assert handler.read_file(file_path) == file_path.read_text(encoding="utf-8")
+
+    def test_read_file_opens_binary_descriptor(
+        self, handler: FileSystemHandler, tmp_path: Path, monkeypatch
+    ):
+        """Files are opened in binary mode, so a Ctrl-Z byte does not end the read."""
+        file_path = tmp_path / "ctrlz.adoc"
+        file_path.write_bytes(b"before\x1aafter\r\n")
+        fake_binary = 0x40000000
+        flags_used = []
+        original_open = os.open
+
+        def fake_open(path, flags, *args):
+            flags_used.append(flags)
+            return original_open(path, flags & ~fake_binary, *args)
+
+        monkeypatch.setattr(os, "O_BINARY", fake_binary, raising=False)
+        monkeypatch.setattr(os, "open", fake_open)
+
+        assert handler.read_file(file_path) == "before\x1aafter\n"
+        assert flags_used and all(flags & fake_binary for flags in flags_used)
+
+
+class TestReadCache:
+    """Tests for the read_file() cache."""
+
+    @staticmethod
+    def _age(path: Path, seconds: int = 60) -> None:
+        """Move the file's modification time into the past."""
+        stat = path.stat()
+        past_ns = stat.st_mtime_ns - seconds * 1_000_000_000
+        os.utime(path, ns=(stat.st_atime_ns, past_ns))
+
+    @staticmethod
+    def _replace_keeping_stat(path: Path, content: str) -> None:
+        """Change file content without changing mtime or size."""
+        stat = path.stat()
+        path.write_text(content, encoding="utf-8")
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    def test_unchanged_file_is_served_from_cache(
+        self, handler: FileSystemHandler, temp_file: Path
+    ):
+        """An old file with unchanged mtime and size is not read again."""
+        self._age(temp_file)
+        original = handler.read_file(temp_file)
+
+        self._replace_keeping_stat(temp_file, original.replace("Line", "LINE"))
+
+        assert handler.read_file(temp_file) == original
+
+    def test_changed_size_invalidates_cache(
+        self, handler: FileSystemHandler, temp_file: Path
+    ):
+        """A change in size is detected even with the same mtime."""
+        self._age(temp_file)
+        handler.read_file(temp_file)
+
+        stat = temp_file.stat()
+        temp_file.write_text("Changed\n", encoding="utf-8")
+        os.utime(temp_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert handler.read_file(temp_file) == "Changed\n"
+
+    def test_recently_modified_file_is_not_cached(
+        self, handler: FileSystemHandler, temp_file: Path
+    ):
+        """Files modified within the racy window are always read from disk."""
+        original = handler.read_file(temp_file)
+
+        self._replace_keeping_stat(temp_file, original.replace("Line", "LINE"))
+
+        assert handler.read_file(temp_file) == original.replace("Line", "LINE")
+
+    def test_write_file_invalidates_cache(
+        self, handler: FileSystemHandler, temp_file: Path
+    ):
+        """Writing through the handler drops the cached content."""
+        self._age(temp_file)
+        original = handler.read_file(temp_file)
+
+        handler.write_file(temp_file, original.replace("Line", "LINE"))
+        self._age(temp_file)
+
+        assert handler.read_file(temp_file) == original.replace("Line", "LINE")
+
+    def test_least_recently_read_file_is_evicted(
+        self, handler: FileSystemHandler, tmp_path: Path, monkeypatch
+    ):
+        """The cache keeps only the most recently read files."""
+        monkeypatch.setattr("dacli.file_handler._READ_CACHE_SIZE", 2)
+        files = []
+        for name in ("a", "b", "c"):
+            path = tmp_path / f"{name}.adoc"
+            path.write_text(f"{name}\n", encoding="utf-8")
+            self._age(path)
+            files.append(path)
+        a, b, c = files
+
+        handler.read_file(a)
+        handler.read_file(b)
+        handler.read_file(a)  # a is now more recently used than b
+        handler.read_file(c)
+
+        self._replace_keeping_stat(a, "A\n")
+        self._replace_keeping_stat(b, "B\n")
+
+        assert handler.read_file(a) == "a\n"
+        assert handler.read_file(b) == "B\n"
+
 
 # =============================================================================
 # read_lines() Tests
 # =============================================================================
 
 
+class TestReadSection:
+    """Tests for read_section() and count_lines()."""
+
+    CONTENTS = [
+        "",
+        "\n",
+        "one line",
+        "one\ntwo\nthree\n",
+        "one\ntwo\nthree",
+        "one\n\n\nfour\n\n",
+        "crlf\r\nlines\r\n",
+        "mixed\nline\u2028breaks\x0c",
+    ]
+
+    @pytest.mark.parametrize("content", CONTENTS)
+    def test_matches_splitlines(
+        self, handler: FileSystemHandler, tmp_path: Path, content: str
+    ):
+        """Results equal slicing and joining splitlines() for every range."""
+        path = tmp_path / "doc.adoc"
+        path.write_bytes(content.encode("utf-8"))
+        lines = content.splitlines()
+
+        assert handler.count_lines(path) == len(lines)
+        for start in range(1, len(lines) + 3):
+            for end in range(0, len(lines) + 3):
+                expected = "\n".join(lines[start - 1 : end])
+                assert handler.read_section(path, start, end) == expected
+
+    def test_write_file_invalidates_line_table(
+        self, handler: FileSystemHandler, temp_file: Path
+    ):
+        """Sections are read from the new content after write_file()."""
+        assert handler.read_section(temp_file, 2, 2) == "Line 2"
+
+        handler.write_file(temp_file, "First\nSecond\n")
+
+        assert handler.read_section(temp_file, 2, 2) == "Second"
+        assert handler.count_lines(temp_file) == 2
+
+    def test_missing_file_raises(self, handler: FileSystemHandler, tmp_path: Path):
+        """Missing files raise FileReadError like read_file()."""
+        with pytest.raises(FileReadError):
+            handler.read_section(tmp_path / "missing.adoc", 1, 2)
+
+
 class TestReadLines:
     """Tests for read_lines() method."""
 
@@ -208,6 +375,67 @@ class TestWriteFile:
         backup_file = temp_file.with_suffix(temp_file.suffix + ".bak")
         assert not backup_file.exists()
 
+    def test_write_file_does_not_copy_original(
+        self, handler: FileSystemHandler, temp_file: Path, monkeypatch
+    ):
+        """The original is replaced atomically without copying it first."""
+
+        def fail(*args, **kwargs):
+            raise AssertionError("original should not be copied")
+
+        monkeypatch.setattr("shutil.copy2", fail)
+
+        handler.write_file(temp_file, "New content\n")
+
+        assert temp_file.read_text(encoding="utf-8") == "New content\n"
+
+    @pytest.mark.parametrize("durable", [False, True])
+    def test_write_file_fsyncs_only_when_durable(
+        self, handler: FileSystemHandler, temp_file: Path, monkeypatch, durable: bool
+    ):
+        """The temp file and its directory are fsync'ed only for durable writes."""
+        synced = []
+        monkeypatch.setattr(os, "fsync", lambda fd: synced.append(os.fstat(fd).st_ino))
+
+        handler.write_file(temp_file, "New content\n", durable=durable)
+
+        assert temp_file.read_text(encoding="utf-8") == "New content\n"
+        if not durable:
+            assert synced == []
+        elif os.name == "nt":
+            assert synced == [temp_file.stat().st_ino]
+        else:
+            # The content first, then the directory entry of the rename
+            assert synced == [temp_file.stat().st_ino, temp_file.parent.stat().st_ino]
+
+    def test_write_file_directory_sync_error_keeps_new_content(
+        self, handler: FileSystemHandler, temp_file: Path, monkeypatch
+    ):
+        """A failed directory fsync is reported, but the replaced file and backup stay."""
+        import dacli.file_handler
+
+        def fail(directory):
+            raise OSError("fsync failed")
+
+        monkeypatch.setattr(dacli.file_handler, "_fsync_directory", fail)
+
+        with pytest.raises(FileWriteError, match="Error syncing directory"):
+            handler.write_file(temp_file, "New content\n", keep_backup=True, durable=True)
+
+        assert temp_file.read_text(encoding="utf-8") == "New content\n"
+        assert temp_file.with_suffix(temp_file.suffix + ".bak").exists()
+
+    def test_write_file_keep_backup(
+        self, handler: FileSystemHandler, temp_file: Path
+    ):
+        """keep_backup=True keeps the previous version as a .bak file."""
+        handler.write_file(temp_file, "First\n", keep_backup=True)
+        handler.write_file(temp_file, "Second\n", keep_backup=True)
+
+        backup_file = temp_file.with_suffix(temp_file.suffix + ".bak")
+        assert backup_file.read_text(encoding="utf-8") == "First\n"
+        assert temp_file.read_text(encoding="utf-8") == "Second\n"
+
     def test_write_file_no_tmp_remains(
         self, handler: FileSystemHandler, temp_file: Path
     ):
@@ -365,6 +593,38 @@ class TestUpdateSection:
                 new_content="content",
             )
 
+    def test_update_section_with_content_does_not_read_file(
+        self, handler: FileSystemHandler, temp_file: Path, monkeypatch
+    ):
+        """The given content is spliced without reading the file again."""
+        content = handler.read_file(temp_file)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("file should not be read again")
+
+        monkeypatch.setattr(handler, "read_file", fail)
+
+        handler.update_section_with_content(
+            temp_file, content, start_line=2, end_line=4, new_content="New Line 2\n"
+        )
+
+        assert temp_file.read_text(encoding="utf-8") == "Line 1\nNew Line 2\nLine 5\n"
+
+    def test_update_section_with_content_invalid_range(
+        self, handler: FileSystemHandler, temp_file: Path
+    ):
+        """Line ranges are validated as in update_section()."""
+        content = handler.read_file(temp_file)
+
+        with pytest.raises(ValueError):
+            handler.update_section_with_content(
+                temp_file, content, start_line=3, end_line=2, new_content="content"
+            )
+        with pytest.raises(ValueError):
+            handler.update_section_with_content(
+                temp_file, content, start_line=1, end_line=100, new_content="content"
+            )
+
 
 # =============================================================================
 # Edge Cases
@@ -126,6 +126,23 @@ class TestFindDocFiles:
 
         assert len(files) == 2
 
+    def test_matches_several_patterns_in_rglob_order(self, tmp_path: Path):
+        """Several patterns should be matched in one walk, in rglob() order."""
+        from dacli.file_utils import find_doc_files
+
+        for name in ["b/c/deep.adoc", "b/mid.md", "a/x.adoc", "top.md", "top.adoc"]:
+            path = tmp_path / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("= Doc")
+
+        files = list(find_doc_files(tmp_path, "*.adoc", "*.md"))
+
+        assert sorted(files) == sorted(
+            list(tmp_path.rglob("*.adoc")) + list(tmp_path.rglob("*.md"))
+        )
+        assert [f for f in files if f.suffix == ".adoc"] == list(tmp_path.rglob("*.adoc"))
+        assert [f for f in files if f.suffix == ".md"] == list(tmp_path.rglob("*.md"))
+
     def test_excludes_gitignored_files(self, tmp_path: Path):
         """Should exclude files matching .gitignore patterns."""
         from dacli.file_utils import find_doc_files
@@ -144,6 +161,32 @@ class TestFindDocFiles:
         assert len(files) == 1
         assert files[0].name == "doc.adoc"
 
+    def test_does_not_descend_into_ignored_directories(self, tmp_path: Path, monkeypatch):
+        """Gitignored and hidden directories should not be scanned at all."""
+        import os
+
+        from dacli.file_utils import find_doc_files
+
+        (tmp_path / ".gitignore").write_text("node_modules/\n")
+        (tmp_path / "doc.adoc").write_text("= Doc")
+        for name in ["node_modules/pkg", ".git/objects", "chapters"]:
+            (tmp_path / name).mkdir(parents=True)
+            (tmp_path / name / "file.adoc").write_text("= File")
+
+        scanned = []
+        original_scandir = os.scandir
+
+        def scandir(path):
+            scanned.append(Path(path).relative_to(tmp_path).as_posix())
+            return original_scandir(path)
+
+        monkeypatch.setattr(os, "scandir", scandir)
+
+        files = list(find_doc_files(tmp_path, "*.adoc"))
+
+        assert sorted(f.name for f in files) == ["doc.adoc", "file.adoc"]
+        assert sorted(scanned) == [".", "chapters"]
+
     def test_excludes_hidden_directories(self, tmp_path: Path):
         """Should exclude hidden directories (starting with .) by default."""
         from dacli.file_utils import find_doc_files
@@ -390,3 +390,66 @@ include::chapters/intro.adoc[]
         main_content = main.read_text()
         assert "include::chapters/intro.adoc[]" in main_content
         assert "Updated content" not in main_content
+
+
+class TestParallelParsing:
+    """Test that parsing root documents in worker processes gives the same index."""
+
+    def _build(self, tmp_path) -> StructureIndex:
+        index = StructureIndex()
+        _build_index(
+            tmp_path,
+            index,
+            AsciidocStructureParser(tmp_path),
+            MarkdownStructureParser(tmp_path),
+            respect_gitignore=False,
+            include_hidden=False,
+            parallel=True,
+        )
+        return index
+
+    def test_parallel_build_matches_serial_build(self, tmp_path, monkeypatch):
+        """Root documents parsed in a process pool keep their order and includes."""
+        import dacli.index_builder
+
+        (tmp_path / "shared.adoc").write_text("== Shared\n\nIncluded text.\n")
+        for name in ("alpha", "beta", "gamma"):
+            (tmp_path / f"{name}.adoc").write_text(
+                f"= {name.title()}\n\n== Part\n\ninclude::shared.adoc[]\n"
+            )
+        (tmp_path / "notes.md").write_text("# Notes\n\n## Todo\n\n```python\nx = 1\n```\n")
+
+        serial = self._build(tmp_path)
+
+        monkeypatch.setattr(dacli.index_builder, "PARALLEL_PARSE_MIN_BYTES", 0)
+        monkeypatch.setattr(dacli.index_builder.os, "cpu_count", lambda: 2)
+        parallel = self._build(tmp_path)
+
+        assert parallel.get_structure() == serial.get_structure()
+        assert parallel.get_section("beta:shared") is not None
+        assert parallel.get_section("notes:todo") is not None
+        assert len(parallel.get_elements(section_path="notes:todo")) == 1
+
+    def test_pool_size_and_threshold(self, tmp_path, monkeypatch):
+        """Small document sets are parsed serially; pools get one worker per file at most."""
+        import dacli.index_builder
+
+        for name in ("alpha", "beta", "gamma"):
+            (tmp_path / f"{name}.adoc").write_text(f"= {name.title()}\n\n== Part\n")
+
+        pools = []
+
+        def executor(**kwargs):
+            pools.append(kwargs["max_workers"])
+            raise OSError("no pool in tests")
+
+        monkeypatch.setattr(dacli.index_builder, "ProcessPoolExecutor", executor)
+        monkeypatch.setattr(dacli.index_builder.os, "cpu_count", lambda: 8)
+
+        self._build(tmp_path)
+        assert pools == []
+
+        monkeypatch.setattr(dacli.index_builder, "PARALLEL_PARSE_MIN_BYTES", 0)
+        index = self._build(tmp_path)
+        assert pools == [3]
+        assert index.get_section("beta:part") is not None
@@ -0,0 +1,215 @@
+"""Tests for the on-disk index cache used by the CLI."""
+
+import os
+import pickle
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from dacli.asciidoc_parser import AsciidocStructureParser
+from dacli.index_cache import (
+    default_cache_dir,
+    get_cache_path,
+    load_documents,
+    load_unchanged_documents,
+    save_documents,
+)
+from dacli.markdown_parser import MarkdownStructureParser
+from dacli.mcp_app import _build_index
+from dacli.structure_index import StructureIndex
+
+
+def _age(*paths: Path, seconds: int = 60) -> None:
+    """Move modification times into the past, out of the racy window."""
+    for path in paths:
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns - seconds * 1_000_000_000))
+
+
+def _build(docs_root: Path, cache_path: Path) -> StructureIndex:
+    """Build an index for docs_root using the given cache file."""
+    index = StructureIndex()
+    _build_index(
+        docs_root,
+        index,
+        AsciidocStructureParser(docs_root),
+        MarkdownStructureParser(docs_root),
+        cache_path=cache_path,
+    )
+    return index
+
+
+def _docs(tmp_path: Path) -> tuple[Path, Path, Path]:
+    """Create a root document including a second file, both aged."""
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    main = docs / "main.adoc"
+    part = docs / "part.adoc"
+    main.write_text("= Main\n\ninclude::part.adoc[]\n", encoding="utf-8")
+    part.write_text("== Part\n\nText.\n", encoding="utf-8")
+    _age(main, part)
+    return docs, main, part
+
+
+class TestCachePath:
+    """Tests for cache location helpers."""
+
+    def test_default_cache_dir_uses_xdg_cache_home(self, tmp_path, monkeypatch):
+        """The cache lives below $XDG_CACHE_HOME."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        assert default_cache_dir() == tmp_path / "dacli"
+
+    def test_dacli_cache_dir_overrides_xdg(self, tmp_path, monkeypatch):
+        """$DACLI_CACHE_DIR is used as the cache directory as is."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+        monkeypatch.setenv("DACLI_CACHE_DIR", str(tmp_path / "cache"))
+        assert default_cache_dir() == tmp_path / "cache"
+
+    def test_cache_path_depends_on_options(self, tmp_path):
+        """Each file discovery configuration gets its own cache file."""
+        paths = {
+            get_cache_path(tmp_path, tmp_path, respect_gitignore=g, include_hidden=h)
+            for g in (True, False)
+            for h in (True, False)
+        }
+        assert len(paths) == 4
+
+
+class TestLoadAndSave:
+    """Tests for load_documents() and save_documents()."""
+
+    def test_round_trip(self, tmp_path):
+        """Saved documents are loaded back while files are unchanged."""
+        docs, main, part = _docs(tmp_path)
+        cache_path = tmp_path / "cache" / "index.pickle"
+        documents = [AsciidocStructureParser(docs).parse_file(main)]
+
+        save_documents(cache_path, [main, part], documents)
+
+        assert load_documents(cache_path, [main, part]) == documents
+
+    def test_changed_include_invalidates(self, tmp_path):
+        """A change to an included file invalidates the cache."""
+        docs, main, part = _docs(tmp_path)
+        cache_path = tmp_path / "index.pickle"
+        save_documents(cache_path, [main], [AsciidocStructureParser(docs).parse_file(main)])
+
+        part.write_text("== Part\n\nMore text.\n", encoding="utf-8")
+        _age(part, seconds=30)
+
+        assert load_documents(cache_path, [main]) is None
+
+    def test_different_file_set_invalidates(self, tmp_path):
+        """Added or removed documents invalidate the cache."""
+        docs, main, part = _docs(tmp_path)
+        cache_path = tmp_path / "index.pickle"
+        save_documents(cache_path, [main, part], [])
+
+        assert load_documents(cache_path, [main]) is None
+
+    def test_recently_modified_files_are_not_cached(self, tmp_path):
+        """Nothing is cached while a file is within the racy window."""
+        docs, main, part = _docs(tmp_path)
+        main.touch()
+        cache_path = tmp_path / "index.pickle"
+
+        save_documents(cache_path, [main, part], [])
+
+        assert not cache_path.exists()
+
+    def test_unreadable_cache_is_ignored(self, tmp_path):
+        """A corrupt cache file is treated as a cache miss."""
+        cache_path = tmp_path / "index.pickle"
+        cache_path.write_bytes(b"not a pickle")
+
+        assert load_documents(cache_path, []) is None
+
+    def test_other_version_is_ignored(self, tmp_path):
+        """Caches written by another version are not used."""
+        cache_path = tmp_path / "index.pickle"
+        data = {"version": (0, "0.0.0"), "doc_files": [], "fingerprint": {}, "documents": []}
+        cache_path.write_bytes(pickle.dumps(data))
+
+        assert load_documents(cache_path, []) is None
+
+    def test_unchanged_documents_survive_a_stale_cache(self, tmp_path):
+        """Only documents depending on a changed file are dropped."""
+        docs, main, part = _docs(tmp_path)
+        other = docs / "other.adoc"
+        other.write_text("= Other\n\n== Intro\n", encoding="utf-8")
+        _age(other)
+        parser = AsciidocStructureParser(docs)
+        cache_path = tmp_path / "index.pickle"
+        save_documents(
+            cache_path, [main, other, part], [parser.parse_file(main), parser.parse_file(other)]
+        )
+
+        part.write_text("== Part\n\nMore text.\n", encoding="utf-8")
+        _age(part, seconds=30)
+
+        assert list(load_unchanged_documents(cache_path)) == [other]
+
+    def test_unchanged_documents_without_cache(self, tmp_path):
+        """A missing cache file yields no reusable documents."""
+        assert load_unchanged_documents(tmp_path / "index.pickle") == {}
+
+
+class TestBuildIndexWithCache:
+    """Tests for _build_index() with a cache file."""
+
+    def test_second_build_uses_cache(self, tmp_path, monkeypatch):
+        """An unchanged tree is not parsed again."""
+        docs, _, _ = _docs(tmp_path)
+        cache_path = tmp_path / "index.pickle"
+        first = _build(docs, cache_path).get_structure()
+        assert cache_path.exists()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("documents should come from the cache")
+
+        monkeypatch.setattr("dacli.index_builder._parse_documents", fail)
+
+        assert _build(docs, cache_path).get_structure() == first
+
+    def test_stale_cache_parses_changed_documents_only(self, tmp_path, monkeypatch):
+        """After a change, only the affected root document is parsed again."""
+        docs, main, part = _docs(tmp_path)
+        notes = docs / "notes.md"
+        notes.write_text("# Notes\n\n## Todo\n", encoding="utf-8")
+        _age(notes)
+        cache_path = tmp_path / "index.pickle"
+        _build(docs, cache_path)
+
+        part.write_text("== Part\n\nChanged.\n\n=== Detail\n", encoding="utf-8")
+        _age(part, seconds=30)
+
+        parsed = []
+        original = AsciidocStructureParser.parse_file
+
+        def parse_file(self, file_path):
+            parsed.append(file_path)
+            return original(self, file_path)
+
+        monkeypatch.setattr(AsciidocStructureParser, "parse_file", parse_file)
+        monkeypatch.setattr(MarkdownStructureParser, "parse_file", parse_file)
+
+        index = _build(docs, cache_path)
+
+        assert parsed == [main]
+        assert index.get_section("main:part.detail") is not None
+        assert index.get_section("notes:todo") is not None
+
+    def test_cli_no_cache_option(self, tmp_path):
+        """--no-cache neither reads nor writes the cache."""
+        from dacli.cli import cli
+
+        docs, _, _ = _docs(tmp_path)
+        runner = CliRunner()
+
+        result = runner.invoke(cli, ["--docs-root", str(docs), "--no-cache", "structure"])
+        assert result.exit_code == 0
+        assert not default_cache_dir().exists()
+
+        result = runner.invoke(cli, ["--docs-root", str(docs), "structure"])
+        assert result.exit_code == 0
+        assert any(default_cache_dir().glob("index-*.pickle"))
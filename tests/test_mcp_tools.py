@@ -251,6 +251,23 @@ class TestGetElements:
             assert "parent_section" in elem
             assert "location" in elem
 
+    async def test_get_elements_content_limit(self, tmp_path: Path):
+        """content_limit truncates the output, not the indexed content (Issue #159)."""
+        (tmp_path / "code.adoc").write_text(
+            "= Code\n\n== Example\n\n[source,text]\n----\nline 1\nline 2\nline 3\n----\n",
+            encoding="utf-8",
+        )
+        mcp = create_mcp_server(docs_root=tmp_path)
+        async with Client(transport=mcp) as client:
+            arguments = {"element_type": "code", "include_content": True}
+            truncated = await client.call_tool(
+                "get_elements", arguments={**arguments, "content_limit": 2}
+            )
+            full = await client.call_tool("get_elements", arguments=arguments)
+
+        assert truncated.data["elements"][0]["attributes"]["content"] == "line 1\nline 2"
+        assert full.data["elements"][0]["attributes"]["content"] == "line 1\nline 2\nline 3"
+
 
 # =============================================================================
 # Manipulation Tools Tests
@@ -277,6 +294,29 @@ class TestUpdateSection:
         content = doc_file.read_text(encoding="utf-8")
         assert "Updated content" in content
 
+    async def test_update_section_rebuilds_index_without_process_pool(
+        self, temp_doc_dir: Path, monkeypatch
+    ):
+        """Index rebuilds after writes parse serially, however large the docs are."""
+        import dacli.index_builder
+
+        def executor(**kwargs):
+            raise AssertionError("MCP index builds should not start a process pool")
+
+        monkeypatch.setattr(dacli.index_builder, "ProcessPoolExecutor", executor)
+        monkeypatch.setattr(dacli.index_builder, "PARALLEL_PARSE_MIN_BYTES", 0)
+        monkeypatch.setattr(dacli.index_builder.os, "cpu_count", lambda: 8)
+        (temp_doc_dir / "other.adoc").write_text("= Other\n\n== Part\n", encoding="utf-8")
+
+        mcp = create_mcp_server(docs_root=temp_doc_dir)
+        async with Client(transport=mcp) as client:
+            result = await client.call_tool(
+                "update_section",
+                arguments={"path": "test:introduction", "content": "Updated content.\n"},
+            )
+
+        assert result.data["success"] is True
+
     async def test_update_section_preserve_title(
         self, mcp_client: Client, temp_doc_dir: Path
     ):
@@ -574,6 +614,30 @@ class TestOptimisticLocking:
         assert "previous_hash" in result.data
         assert "new_hash" in result.data
 
+    async def test_hash_values_are_crc32_hex(
+        self, mcp_client: Client, temp_doc_dir: Path
+    ):
+        """Hashes are CRC-32 checksums formatted as 8 lowercase hex chars."""
+        import re
+        import zlib
+
+        from dacli.services import compute_hash
+
+        assert compute_hash("hello") == f"{zlib.crc32(b'hello'):08x}" == "3610a686"
+
+        result = await mcp_client.call_tool(
+            "update_section",
+            arguments={
+                "path": "test:introduction",
+                "content": "== Introduction\n\nChecksum test.\n",
+            },
+        )
+
+        assert re.fullmatch("[0-9a-f]{8}", result.data["previous_hash"])
+        assert result.data["new_hash"] == compute_hash(
+            "== Introduction\n\nChecksum test.\n\n"
+        )
+
 
 # =============================================================================
 # Metadata Tests (Issue #10)
@@ -611,6 +675,27 @@ class TestGetMetadata:
         assert "last_modified" in result.data
         assert "subsection_count" in result.data
 
+    async def test_get_metadata_last_modified_skips_deleted_files(
+        self, mcp_client: Client, temp_doc_dir: Path
+    ):
+        """Files deleted after indexing do not break last_modified."""
+        from datetime import UTC, datetime
+
+        doc_file = temp_doc_dir / "test.adoc"
+        expected = datetime.fromtimestamp(doc_file.stat().st_mtime, tz=UTC).isoformat()
+
+        result = await mcp_client.call_tool("get_metadata", arguments={})
+        assert result.data["last_modified"] == expected
+
+        doc_file.unlink()
+        project = await mcp_client.call_tool("get_metadata", arguments={})
+        section = await mcp_client.call_tool(
+            "get_metadata", arguments={"path": "test:introduction"}
+        )
+
+        assert project.data["last_modified"] is None
+        assert section.data["last_modified"] is None
+
     async def test_get_metadata_invalid_path_returns_error(self, mcp_client: Client):
         """get_metadata with invalid path returns error."""
         result = await mcp_client.call_tool(
@@ -645,3 +730,38 @@ class TestValidateStructure:
         assert "validation_time_ms" in result.data
         assert isinstance(result.data["validation_time_ms"], (int, float))
         assert result.data["validation_time_ms"] >= 0
+
+    def test_validate_structure_resolves_each_path_once(
+        self, temp_doc_dir: Path, monkeypatch
+    ):
+        """Indexed files that are discovered again are not resolved twice."""
+        from collections import Counter
+
+        from dacli.asciidoc_parser import AsciidocStructureParser
+        from dacli.markdown_parser import MarkdownStructureParser
+        from dacli.mcp_app import _build_index
+        from dacli.services import validate_structure
+        from dacli.structure_index import StructureIndex
+
+        (temp_doc_dir / "orphan.md").write_text("# Orphan\n", encoding="utf-8")
+        index = StructureIndex()
+        _build_index(
+            temp_doc_dir,
+            index,
+            AsciidocStructureParser(temp_doc_dir),
+            MarkdownStructureParser(temp_doc_dir),
+        )
+        index._file_to_sections.pop(temp_doc_dir / "orphan.md")
+
+        calls: Counter = Counter()
+        original_resolve = Path.resolve
+
+        def counting_resolve(self, *args, **kwargs):
+            calls[self] += 1
+            return original_resolve(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "resolve", counting_resolve)
+        result = validate_structure(index, temp_doc_dir)
+
+        assert [w["path"] for w in result["warnings"]] == ["orphan.md"]
+        assert calls[temp_doc_dir / "test.adoc"] == 1
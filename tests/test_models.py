@@ -108,6 +108,19 @@ class TestSection:
 
         assert section.anchor == "intro-anchor"
 
+    def test_section_uses_slots(self):
+        """Test that Section carries no per-instance __dict__."""
+        from dacli.models import Section, SourceLocation
+
+        section = Section(
+            title="Introduction",
+            level=1,
+            path="introduction",
+            source_location=SourceLocation(file=Path("doc.adoc"), line=1),
+        )
+
+        assert not hasattr(section, "__dict__")
+
 
 class TestElement:
     """Tests for Element dataclass."""
@@ -204,6 +217,21 @@ class TestElement:
         assert element.type == "admonition"
         assert element.attributes["admonition_type"] == "WARNING"
 
+    def test_element_uses_slots(self):
+        """Test that Element and SourceLocation carry no per-instance __dict__."""
+        from dacli.models import Element, SourceLocation
+
+        loc = SourceLocation(file=Path("doc.adoc"), line=1)
+        element = Element(
+            type="image",
+            source_location=loc,
+            attributes={"target": "a.png", "alt": ""},
+            parent_section="doc",
+        )
+
+        assert not hasattr(loc, "__dict__")
+        assert not hasattr(element, "__dict__")
+
 
 class TestCrossReference:
     """Tests for CrossReference dataclass."""
@@ -498,6 +498,54 @@ class TestGetElements:
         elements = index.get_elements(element_type="code", section_path="intro")
         assert len(elements) == 1
 
+    def test_get_elements_recursive_matches_subtree_only(self):
+        """Recursive filtering follows "." and ":" separators in document order."""
+        parents = [
+            "doc:intro.goals",
+            "doc:intro",
+            "doc:intro-2",
+            "doc:intro.goals.detail",
+            "doc",
+            "doc:introduction",
+            "doc:intro.a",
+        ]
+        index = StructureIndex()
+        index.build_from_documents(
+            [
+                Document(
+                    file_path=Path("doc.adoc"),
+                    title="Doc",
+                    elements=[
+                        Element(
+                            type="code" if line % 2 else "table",
+                            source_location=SourceLocation(file=Path("doc.adoc"), line=line),
+                            attributes={},
+                            parent_section=parent,
+                        )
+                        for line, parent in enumerate(parents, start=1)
+                    ],
+                )
+            ]
+        )
+
+        def parents_of(elements):
+            return [e.parent_section for e in elements]
+
+        assert parents_of(index.get_elements(section_path="doc:intro", recursive=True)) == [
+            "doc:intro.goals",
+            "doc:intro",
+            "doc:intro.goals.detail",
+            "doc:intro.a",
+        ]
+        assert parents_of(
+            index.get_elements(element_type="code", section_path="doc:intro", recursive=True)
+        ) == ["doc:intro.goals", "doc:intro.a"]
+        assert parents_of(index.get_elements(section_path="doc", recursive=True)) == parents
+        assert parents_of(index.get_elements(section_path="doc:intro-2", recursive=True)) == [
+            "doc:intro-2"
+        ]
+        assert index.get_elements(section_path="missing", recursive=True) == []
+
 
 class TestSearch:
     """Tests for search() method."""
@@ -830,6 +878,97 @@ class TestGetSectionsByFile:
         assert index.get_sections_by_file(file_path) == []
 
 
+class TestGetSubtreeEndLine:
+    """Tests for get_subtree_end_line() method."""
+
+    @staticmethod
+    def _documents(end_line_of_grandchild: int | None = 30) -> list[Document]:
+        main = Path("main.adoc")
+        other = Path("other.adoc")
+        grandchild = Section(
+            title="Detail",
+            level=3,
+            path="main:intro.goals.detail",
+            source_location=SourceLocation(
+                file=main, line=25, end_line=end_line_of_grandchild
+            ),
+        )
+        included = Section(
+            title="Included",
+            level=2,
+            path="main:intro.included",
+            source_location=SourceLocation(file=other, line=1, end_line=99),
+        )
+        root = Section(
+            title="Main",
+            level=0,
+            path="main",
+            source_location=SourceLocation(file=main, line=1, end_line=4),
+            children=[
+                Section(
+                    title="Intro",
+                    level=1,
+                    path="main:intro",
+                    source_location=SourceLocation(file=main, line=5, end_line=19),
+                    children=[
+                        Section(
+                            title="Goals",
+                            level=2,
+                            path="main:intro.goals",
+                            source_location=SourceLocation(file=main, line=20, end_line=24),
+                            children=[grandchild],
+                        ),
+                        included,
+                    ],
+                ),
+                Section(
+                    title="Intro 2",
+                    level=1,
+                    path="main:intro-2",
+                    source_location=SourceLocation(file=main, line=31, end_line=40),
+                ),
+            ],
+        )
+        return [Document(file_path=main, title="Main", sections=[root])]
+
+    def _build_index(self, end_line_of_grandchild: int | None = 30) -> StructureIndex:
+        index = StructureIndex()
+        index.build_from_documents(self._documents(end_line_of_grandchild))
+        return index
+
+    def test_includes_descendants_in_same_file(self):
+        """The subtree ends with the last descendant, ignoring other files and siblings."""
+        index = self._build_index()
+
+        assert index.get_subtree_end_line(index.get_section("main")) == 40
+        assert index.get_subtree_end_line(index.get_section("main:intro")) == 30
+        assert index.get_subtree_end_line(index.get_section("main:intro.goals")) == 30
+        assert index.get_subtree_end_line(index.get_section("main:intro-2")) == 40
+
+    def test_section_without_descendants(self):
+        """A leaf section ends at its own end line."""
+        index = self._build_index()
+
+        assert index.get_subtree_end_line(index.get_section("main:intro.goals.detail")) == 30
+        assert index.get_subtree_end_line(index.get_section("main:intro.included")) == 99
+
+    def test_unknown_end_line_propagates(self):
+        """An unknown end line in the subtree makes the result unknown."""
+        index = self._build_index(end_line_of_grandchild=None)
+
+        assert index.get_subtree_end_line(index.get_section("main:intro")) is None
+        assert index.get_subtree_end_line(index.get_section("main:intro-2")) == 40
+
+    def test_reset_on_rebuild(self):
+        """Cached values are discarded when the index is rebuilt."""
+        index = self._build_index()
+        assert index.get_subtree_end_line(index.get_section("main")) == 40
+
+        index.build_from_documents(self._documents(end_line_of_grandchild=50))
+
+        assert index.get_subtree_end_line(index.get_section("main")) == 50
+
+
 class TestElementIndex:
     """Tests for element index tracking within sections."""
 
@@ -1605,3 +1744,73 @@ class TestGetSuggestionsFilePrefixFormat:
         assert len(suggestions) > 0
         # Should suggest the correct nested section
         assert "api/endpoints:get.parameters" in suggestions
+
+
+class TestWordCounts:
+    """Tests for get_word_count() and get_total_word_count()."""
+
+    @staticmethod
+    def _build_index(tmp_path: Path) -> StructureIndex:
+        test_file = tmp_path / "test.adoc"
+        test_file.write_text(
+            "== One\n\nalpha beta\n\n== Two\n\ngamma\tdelta  epsilon\n",
+            encoding="utf-8",
+        )
+        index = StructureIndex()
+        index.build_from_documents(
+            [
+                Document(
+                    file_path=test_file,
+                    title="Test",
+                    sections=[
+                        Section(
+                            title="One",
+                            level=1,
+                            path="one",
+                            source_location=SourceLocation(file=test_file, line=1, end_line=4),
+                        ),
+                        Section(
+                            title="Two",
+                            level=1,
+                            path="two",
+                            source_location=SourceLocation(file=test_file, line=5, end_line=7),
+                        ),
+                    ],
+                )
+            ]
+        )
+        return index
+
+    def test_counts_words_of_section_content(self, tmp_path: Path):
+        """Word counts split content on any whitespace, title included."""
+        index = self._build_index(tmp_path)
+
+        assert index.get_word_count("one") == 4
+        assert index.get_word_count("two") == 5
+        assert index.get_word_count("missing") == 0
+        assert index.get_total_word_count() == 9
+
+    def test_counts_are_reset_on_rebuild(self, tmp_path: Path):
+        """Memoized counts do not survive clear()."""
+        index = self._build_index(tmp_path)
+        assert index.get_word_count("one") == 4
+
+        index.clear()
+
+        assert index.get_word_count("one") == 0
+        assert index.get_total_word_count() == 0
+
+    def test_source_file_is_read_once_per_build(self, tmp_path: Path, monkeypatch):
+        """All sections of a file take their content from a single read."""
+        reads = []
+        original = Path.read_text
+
+        def read_text(self, *args, **kwargs):
+            reads.append(self)
+            return original(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "read_text", read_text)
+        index = self._build_index(tmp_path)
+
+        assert reads == [tmp_path / "test.adoc"]
+        assert index._section_content["two"] == "== Two\n\ngamma\tdelta  epsilon"